@@ -1,13 +1,79 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import threading
+import queue
 import json
+import os
+import time
 from urllib.parse import urlparse
 from pathlib import Path
 import launcher
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_PATH = BASE_DIR / "apps" / "config.json"
+PING_CACHE_TTL = 1.5  # seconds a connectivity probe result is reused
+# Connectivity poll backs off while the state is unchanged and resets on transitions
+PING_INTERVAL_MIN_MS = 1000
+PING_INTERVAL_MAX_MS = 10000
+# Connectivity indicator colors: state -> (dot fill, label fg)
+_STATUS_COLORS = {
+    True: ("#2e7d32", "#2e7d32"),   # green
+    False: ("#c62828", "#c62828"),  # red
+    None: ("#999999", "#666666"),   # gray / unknown
+}
+STATUS_TICK_MS = 500  # single UI tick; the connectivity probe runs every Nth tick
+# Process exits are reported by _watch_process; this fallback re-poll catches anything else
+PROC_FALLBACK_TICKS = 4
+
+
+def _json_loads(data: bytes):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _json_dumps(obj) -> bytes:
+    # Both paths emit 2-space indented UTF-8 with non-ASCII characters kept as-is
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _parse_endpoint(raw: str, bare_host: str, bare_port: int) -> tuple[str, int]:
+    """Split the Redis field (url, host:port or bare host) into (host, port).
+
+    bare_host/bare_port apply only when raw has no port of its own; an explicit but
+    unparsable port falls back to the Redis default 6379.
+    """
+    if "://" in raw:
+        pr = urlparse(raw)
+        return pr.hostname or "localhost", pr.port or 6379
+    if ":" in raw:
+        h, p = raw.split(":", 1)
+        try:
+            return h or "localhost", int(p)
+        except Exception:
+            return h or "localhost", 6379
+    return raw or bare_host, bare_port
+
+
+def _set_var(var, value):
+    # Skip the Tcl write (and any redraw) when the value is already displayed
+    if var.get() != value:
+        var.set(value)
+
+
+def _set_text(widget, text):
+    if widget.cget("text") != text:
+        widget.config(text=text)
+
 
 class AppGUI(tk.Tk):
     def __init__(self):
@@ -17,6 +83,11 @@ class AppGUI(tk.Tk):
         self.resizable(False, False)
 
         self.config_data = self._load_config()
+        # Serialized form of what is on disk; save_config skips the write when nothing changed
+        self._last_config_json = self._serialize_config() if CONFIG_PATH.exists() else b""
+        # Background config writes run one at a time; only the newest save's payload is written
+        self._config_write_lock = threading.Lock()
+        self._config_write_seq = 0
 
         # Redis 连接性（Ping URL）
         frame = ttk.LabelFrame(self)
@@ -24,13 +95,15 @@ class AppGUI(tk.Tk):
         # 顶部标题 + 状态
         header = ttk.Frame(frame)
         header.grid(row=0, column=0, columnspan=5, sticky="we")
-        ttk.Label(header, text="连接状态 / Redis", font=("Segoe UI", 10, "bold")).pack(side="left", padx=(6, 0), pady=(6, 0))
+        # One shared font object instead of resolving the same tuple per widget
+        self._bold_font = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        ttk.Label(header, text="连接状态 / Redis", font=self._bold_font).pack(side="left", padx=(6, 0), pady=(6, 0))
         self.ping_status = tk.StringVar(value="未知")
         # 显示一个彩色状态点 + 粗体文字
         self.status_canvas = tk.Canvas(header, width=14, height=14, highlightthickness=0)
         self.status_canvas.pack(side="left", padx=(8, 2), pady=(6, 0))
         self._status_dot = self.status_canvas.create_oval(2, 2, 12, 12, outline="", fill="#999999")
-        self.status_label = tk.Label(header, textvariable=self.ping_status, font=("Segoe UI", 10, "bold"))
+        self.status_label = tk.Label(header, textvariable=self.ping_status, font=self._bold_font)
         self.status_label.pack(side="left", padx=(2, 6), pady=(6, 0))
         # 输入区域
         ttk.Label(frame, text="Redis（主机[:端口]）：").grid(row=1, column=0, sticky="w", padx=6, pady=6)
@@ -48,6 +121,7 @@ class AppGUI(tk.Tk):
         save_btn = ttk.Button(frame, text="应用并保存", command=self.save_config)
         save_btn.grid(row=1, column=2, padx=6)
         # 初始化状态显示
+        self._status_colors = None  # (fill, fg) currently shown
         self._update_status_visual(None)
 
         # 控制区
@@ -71,25 +145,44 @@ class AppGUI(tk.Tk):
         # 线程安全的轮询
         self._polling = True
         self._online = None  # Redis 连通性：True/False/None（未知）
-        self.after(500, self._poll_status)
-        self.after(1000, self._poll_ping)
+        self._ping_cache = {}  # target -> (monotonic ts, ok)
+        self._ping_interval_ms = PING_INTERVAL_MIN_MS
+        self._ticks_until_probe = PING_INTERVAL_MIN_MS // STATUS_TICK_MS
+        self._probe_inflight = False
+        self._proc_state = (False, False)  # (ctrl_running, browser_open) from the last refresh
+        self._last_btn_state = None  # inputs of the last _apply_connectivity_to_buttons run
+        self._ticks_until_proc_poll = 1
+        # Callbacks posted from worker threads are coalesced: at most one pending per kind
+        self._post_lock = threading.Lock()
+        self._pending_probe = None        # latest probe result waiting for the Tk thread
+        self._probe_apply_scheduled = False
+        self._refresh_scheduled = False
+        self._parsed_target_cache = (None, None)  # (raw ping field, resolved host:port)
+        # Single long-lived probe worker fed by _probe_connectivity
+        self._probe_q = queue.Queue()
+        threading.Thread(target=self._probe_loop, daemon=True).start()
+        self.after(STATUS_TICK_MS, self._poll_status)
+        self.bind("<Map>", self._on_map)
 
         # 进程引用
         self._ctrl_proc = None
         self._browser_opened = False
         # 自启动：等待连通性后启动无人船和浏览器
         self._cancel_event = threading.Event()
-        self._start_on_launch()
+        # Let Tk paint the first frame before the connectivity wait starts
+        self.after(50, self._start_on_launch)
 
     def _load_config(self):
         if not CONFIG_PATH.exists():
             return {}
         try:
-            with CONFIG_PATH.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return _json_loads(CONFIG_PATH.read_bytes())
         except Exception:
             return {}
 
+    def _serialize_config(self) -> bytes:
+        return _json_dumps(self.config_data)
+
     def _initial_ping_value(self) -> str:
         # Prefer ping_url; else compose from redis.host:redis.port; else launcher.PING_URL
         if isinstance(self.config_data, dict):
@@ -106,24 +199,15 @@ class AppGUI(tk.Tk):
 
     def _resolve_ping_target_for_connectivity(self) -> str:
         raw = (self.ping_var.get() or "").strip()
-        host = None
-        port = None
-        if "://" in raw:
-            pr = urlparse(raw)
-            host = pr.hostname or "localhost"
-            port = pr.port or 6379
-        else:
-            if ":" in raw:
-                h, p = raw.split(":", 1)
-                host = h or "localhost"
-                try:
-                    port = int(p)
-                except Exception:
-                    port = 6379
-            else:
-                host = raw or (self.config_data.get("redis", {}).get("host") or "localhost")
-                port = int(self.config_data.get("redis", {}).get("port", 6379))
-        return f"{host}:{port}"
+        # The field rarely changes between polls; reuse the last resolution
+        cached_raw, cached_target = self._parsed_target_cache
+        if raw == cached_raw:
+            return cached_target
+        redis_cfg = self.config_data.get("redis", {})
+        host, port = _parse_endpoint(raw, redis_cfg.get("host") or "localhost", int(redis_cfg.get("port", 6379)))
+        target = f"{host}:{port}"
+        self._parsed_target_cache = (raw, target)
+        return target
 
     def _start_on_launch(self):
         # Start a new background worker; prior worker will observe cancel flag
@@ -139,41 +223,102 @@ class AppGUI(tk.Tk):
                 return
             # Start USV app (MultiMonitorTool in launcher will move it)
             self._ctrl_proc = launcher.launch_process(launcher.CTRL_EXE)
+            self._watch_process(self._ctrl_proc)
             # Start browser (MultiMonitorTool will move it)
             launcher.open_browser_fullscreen(launcher.CHART_URL)
             self._browser_opened = True
+            self._watch_process(launcher._browser_process)
+            self._request_process_refresh()
         except Exception as e:
             self.after(0, lambda: messagebox.showerror("启动错误", str(e)))
 
-    def _poll_ping(self):
+    def _cached_can_reach(self, target: str) -> bool:
+        """Return launcher._can_reach(target), reusing a result younger than PING_CACHE_TTL."""
+        now = time.monotonic()
+        hit = self._ping_cache.get(target)
+        if hit is not None and now - hit[0] < PING_CACHE_TTL:
+            return hit[1]
+        ok = launcher._can_reach(target)
+        self._ping_cache[target] = (time.monotonic(), ok)
+        return ok
+
+    def _on_map(self, event):
+        # Window restored from minimized/withdrawn: refresh connectivity on the next tick
+        if event.widget is not self:
+            return
+        self._ping_interval_ms = PING_INTERVAL_MIN_MS
+        self._ticks_until_probe = 1
+
+    def _probe_connectivity(self):
+        """Queue one connectivity probe for the worker thread; driven from _poll_status."""
+        self._probe_inflight = True
         try:
-            target = self._resolve_ping_target_for_connectivity()
-            # Avoid blocking UI; do in thread and update UI on completion
-            def worker():
-                ok = launcher._can_reach(target)
-                def apply():
-                    self._online = bool(ok)
-                    self.ping_status.set("在线" if ok else "离线")
-                    self._apply_connectivity_to_buttons()
-                    self._update_status_visual(ok)
-                self.after(0, apply)
-            threading.Thread(target=worker, daemon=True).start()
+            self._probe_q.put(self._resolve_ping_target_for_connectivity())
         except Exception:
             self.ping_status.set("Error")
-        finally:
-            if self._polling:
-                self.after(2000, self._poll_ping)
+            self._ticks_until_probe = max(1, self._ping_interval_ms // STATUS_TICK_MS)
+            self._probe_inflight = False
+
+    def _probe_loop(self):
+        """Persistent worker: probe queued targets and post results back to the Tk thread."""
+        while True:
+            target = self._probe_q.get()
+            if target is None:
+                return
+            ok = self._cached_can_reach(target)
+            try:
+                self._post_probe_result(ok)
+            except Exception:
+                # Window already destroyed
+                return
 
-    def _apply_connectivity_to_buttons(self):
-        """Disable Start/Open when offline; keep Stop/Close enabled."""
-        # Determine current running/open states
-        ctrl_running = bool(self._ctrl_proc and self._ctrl_proc.poll() is None)
-        browser_open = False
-        if getattr(launcher, "_browser_process", None) and launcher._browser_process.poll() is None:
-            browser_open = True
+    def _post_probe_result(self, ok):
+        # Keep only the newest result; schedule a single drain on the Tk thread
+        with self._post_lock:
+            self._pending_probe = ok
+            if self._probe_apply_scheduled:
+                return
+            self._probe_apply_scheduled = True
+        self.after(0, self._drain_probe_result)
+
+    def _drain_probe_result(self):
+        with self._post_lock:
+            ok = self._pending_probe
+            self._probe_apply_scheduled = False
+        self._apply_probe_result(ok)
+
+    def _request_process_refresh(self):
+        """Thread-safe: schedule one _refresh_process_status no matter how many callers ask."""
+        with self._post_lock:
+            if self._refresh_scheduled:
+                return
+            self._refresh_scheduled = True
+        self.after(0, self._run_process_refresh)
+
+    def _run_process_refresh(self):
+        with self._post_lock:
+            self._refresh_scheduled = False
+        self._refresh_process_status()
+
+    def _apply_probe_result(self, ok):
+        ok_b = bool(ok)
+        if ok_b == self._online:
+            self._ping_interval_ms = min(self._ping_interval_ms * 2, PING_INTERVAL_MAX_MS)
         else:
-            browser_open = bool(self._browser_opened)
-
+            self._ping_interval_ms = PING_INTERVAL_MIN_MS
+        self._online = ok_b
+        _set_var(self.ping_status, "在线" if ok else "离线")
+        self._apply_connectivity_to_buttons(*self._proc_state)
+        self._update_status_visual(ok)
+        self._ticks_until_probe = max(1, self._ping_interval_ms // STATUS_TICK_MS)
+        self._probe_inflight = False
+
+    def _apply_connectivity_to_buttons(self, ctrl_running: bool, browser_open: bool):
+        """Disable Start/Open when offline; keep Stop/Close enabled."""
+        key = (ctrl_running, browser_open, self._online)
+        if key == self._last_btn_state:
+            return
+        self._last_btn_state = key
         if self._online is False:
             # If offline, only disable actions that would start things
             if ctrl_running:
@@ -194,19 +339,15 @@ class AppGUI(tk.Tk):
         """Update the colored dot and label color based on connectivity state.
         ok=True -> green, ok=False -> red, ok=None -> gray.
         """
-        if ok is True:
-            fill = "#2e7d32"  # green
-            fg = "#2e7d32"
-        elif ok is False:
-            fill = "#c62828"  # red
-            fg = "#c62828"
-        else:
-            fill = "#999999"  # gray / unknown
-            fg = "#666666"
+        colors = _STATUS_COLORS.get(ok, _STATUS_COLORS[None])
+        if self._status_colors == colors:
+            return
+        fill, fg = colors
         try:
             self.status_canvas.itemconfig(self._status_dot, fill=fill)
             # status_label is a tk.Label so we can set fg directly
             self.status_label.configure(fg=fg)
+            self._status_colors = colors
         except Exception:
             pass
 
@@ -214,24 +355,8 @@ class AppGUI(tk.Tk):
         # Interpret ping field as Redis endpoint; update config.json and launcher
         raw = self.ping_var.get().strip()
         chart_url = self.chart_var.get().strip()
-        host = None
-        port = None
-        if "://" in raw:
-            pr = urlparse(raw)
-            host = pr.hostname or "localhost"
-            port = pr.port or 6379
-        else:
-            if ":" in raw:
-                h, p = raw.split(":", 1)
-                host = h or "localhost"
-                try:
-                    port = int(p)
-                except Exception:
-                    port = 6379
-            else:
-                host = raw or "localhost"
-                # keep existing port if available else default 6379
-                port = int(self.config_data.get("redis", {}).get("port", 6379))
+        # A bare host keeps the existing port if available else default 6379
+        host, port = _parse_endpoint(raw, "localhost", int(self.config_data.get("redis", {}).get("port", 6379)))
 
         self.config_data.setdefault("redis", {})["host"] = host
         self.config_data.setdefault("redis", {})["port"] = port
@@ -239,9 +364,20 @@ class AppGUI(tk.Tk):
         self.config_data["ping_url"] = raw
         # Store chart_url
         self.config_data["chart_url"] = chart_url
+        payload = self._serialize_config()
+        # Nothing changed: skip only the disk write; saving still retries the auto-start below
+        changed = payload != self._last_config_json
         try:
-            with CONFIG_PATH.open("w", encoding="utf-8") as f:
-                json.dump(self.config_data, f, indent=2, ensure_ascii=False)
+            if changed:
+                # Persist off the UI thread; the in-memory settings below take effect immediately
+                self._last_config_json = payload
+                self._config_write_seq += 1
+                threading.Thread(target=self._write_config, args=(payload, self._config_write_seq)).start()
+                # Drop cached probe results; the target may have changed
+                self._ping_cache.clear()
+                self._parsed_target_cache = (None, None)
+                self._ping_interval_ms = PING_INTERVAL_MIN_MS
+                self._ticks_until_probe = 1
             # Cancel any ongoing connectivity wait and apply to running launcher
             try:
                 self._cancel_event.set()
@@ -253,13 +389,34 @@ class AppGUI(tk.Tk):
             launcher.PING_URL = f"{host}:{port}"
             if chart_url:
                 launcher.CHART_URL = chart_url
-            messagebox.showinfo("已保存", "配置已保存并生效。")
+            messagebox.showinfo("已保存", "配置已保存并生效。" if changed else "配置未更改。")
             # Optionally restart auto-start if nothing is running yet
-            if not (self._ctrl_proc and self._ctrl_proc.poll() is None):
+            # Reuse the state from the last status refresh rather than polling again
+            ctrl_running, _ = self._proc_state
+            if not ctrl_running:
                 self._start_on_launch()
         except Exception as e:
             messagebox.showerror("保存失败", str(e))
 
+    def _write_config(self, payload: bytes, seq: int):
+        # Write to a temp file and swap it in so config.json is never left half-written
+        with self._config_write_lock:
+            if seq != self._config_write_seq:
+                # A newer save is queued behind us; its payload is the one to keep
+                return
+            try:
+                tmp = CONFIG_PATH.with_suffix(".json.tmp")
+                tmp.write_bytes(payload)
+                os.replace(tmp, CONFIG_PATH)
+            except Exception as e:
+                msg = str(e)
+                self.after(0, lambda m=msg: self._config_write_failed(m))
+
+    def _config_write_failed(self, msg: str):
+        # Force the next save to retry the write
+        self._last_config_json = None
+        messagebox.showerror("保存失败", msg)
+
     def toggle_ctrl(self):
         if self._ctrl_proc and self._ctrl_proc.poll() is None:
             # stop just the ctrl process (entire tree)
@@ -272,10 +429,13 @@ class AppGUI(tk.Tk):
             except Exception:
                 pass
             self._ctrl_proc = None
+            self._refresh_process_status()
             return
         # start
         # MultiMonitorTool in launcher will move it; no monitor index needed here
         self._ctrl_proc = launcher.launch_process(launcher.CTRL_EXE)
+        self._watch_process(self._ctrl_proc)
+        self._refresh_process_status()
 
     def toggle_chart(self):
         # toggle browser only
@@ -297,42 +457,82 @@ class AppGUI(tk.Tk):
                 launcher._browser_process = None
             except Exception:
                 pass
+            self._refresh_process_status()
             return
         launcher.open_browser_fullscreen(launcher.CHART_URL)
         self._browser_opened = True
+        self._watch_process(launcher._browser_process)
+        self._refresh_process_status()
 
     # chart backend toggle removed
 
-    def _poll_status(self):
+    def _watch_process(self, proc):
+        """Wait on proc in a daemon thread and refresh the status as soon as it exits."""
+        if proc is None:
+            return
+        def waiter():
+            try:
+                proc.wait()
+            except Exception:
+                pass
+            try:
+                self._request_process_refresh()
+            except Exception:
+                # Window already destroyed
+                pass
+        threading.Thread(target=waiter, daemon=True).start()
+
+    def _refresh_process_status(self):
+        # Poll each process handle once and reuse the result below
+        ctrl_proc = self._ctrl_proc
+        ctrl_running = bool(ctrl_proc and ctrl_proc.poll() is None)
+        # Prefer actual process check for browser
+        browser_proc = getattr(launcher, "_browser_process", None)
+        browser_open = bool(browser_proc and browser_proc.poll() is None)
+        self._browser_opened = browser_open
+        self._proc_state = (ctrl_running, browser_open)
+        self._ticks_until_proc_poll = PROC_FALLBACK_TICKS
+
         # update statuses
-        if self._ctrl_proc and self._ctrl_proc.poll() is None:
-            self.ctrl_status.set("运行中")
-            self.ctrl_btn.config(text="停止")
+        if ctrl_running:
+            _set_var(self.ctrl_status, "运行中")
+            _set_text(self.ctrl_btn, "停止")
         else:
-            self.ctrl_status.set("已停止")
-            self.ctrl_btn.config(text="启动")
+            _set_var(self.ctrl_status, "已停止")
+            _set_text(self.ctrl_btn, "启动")
         # chart backend status removed
-        # Prefer actual process check for browser
-        if getattr(launcher, "_browser_process", None) and launcher._browser_process.poll() is None:
-            self._browser_opened = True
+        if browser_open:
+            _set_var(self.chart_status, "已打开")
+            _set_text(self.chart_btn, "关闭")
         else:
-            self._browser_opened = False
-
-        if self._browser_opened:
-            self.chart_status.set("已打开")
-            self.chart_btn.config(text="关闭")
-        else:
-            self.chart_status.set("已关闭")
-            self.chart_btn.config(text="打开")
+            _set_var(self.chart_status, "已关闭")
+            _set_text(self.chart_btn, "打开")
 
         # Apply enable/disable rules after we set the button texts
-        self._apply_connectivity_to_buttons()
+        self._apply_connectivity_to_buttons(ctrl_running, browser_open)
+
+    def _poll_status(self):
+        # Process exits arrive via _watch_process; only re-poll handles as a slow fallback
+        self._ticks_until_proc_poll -= 1
+        if self._ticks_until_proc_poll <= 0:
+            self._refresh_process_status()
+
+        # Connectivity probe shares this tick instead of running its own timer
+        if not self._probe_inflight:
+            self._ticks_until_probe -= 1
+            if self._ticks_until_probe <= 0:
+                if self.state() in ("iconic", "withdrawn"):
+                    # Nobody can see the status dot; check rarely until the window is mapped again
+                    self._ticks_until_probe = PING_INTERVAL_MAX_MS // STATUS_TICK_MS
+                else:
+                    self._probe_connectivity()
 
         if self._polling:
-            self.after(500, self._poll_status)
+            self.after(STATUS_TICK_MS, self._poll_status)
 
     def on_close(self):
         self._polling = False
+        self._probe_q.put(None)
         launcher.terminate_children()
         self.destroy()
 
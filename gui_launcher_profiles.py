@@ -1,13 +1,37 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog, filedialog
+from tkinter import ttk, messagebox, simpledialog
 from pathlib import Path
+from urllib.parse import urlparse
+import asyncio
 import json
+import functools
+import os
+import shlex
 import threading
+import queue
 import subprocess
-import launcher
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import sys
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+try:
+    import jsonschema
+    JSONSCHEMA_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_AVAILABLE = False
+
 # pyinstaller --onefile --name DuallauncherProfiles gui_launcher_profiles.py
 
 # 在开发环境下使用脚本目录；打包为单文件（PyInstaller）时，使用可执行文件所在目录
@@ -21,39 +45,172 @@ def _resolve_base_dir() -> Path:
 
 BASE_DIR = _resolve_base_dir()
 CONF_PATH = BASE_DIR / "launch.conf"
+CONN_CYCLE_TIMEOUT = 15  # seconds to wait for one round of connectivity probes
+CONN_CONNECT_TIMEOUT = 2.0  # per-target timeout for plain TCP connect probes
+PROC_TICK_MS = 3000      # auto-restart check interval
+CONN_DRAIN_MS = 250      # drain interval while connectivity/status changes keep arriving
+CONN_DRAIN_IDLE_MS = 3000  # the drain backs off (doubling) to this while nothing changes
+
+
+def _json_loads(raw: bytes):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    # json.loads takes bytes directly and detects the encoding itself (a UTF-8 BOM included)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    # Both paths emit 2-space indented UTF-8 with non-ASCII characters kept as-is
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+# Profile field normalization: (field, default, cast, always). Fields with always=False
+# (the optional connectivity wait settings) are only coerced when present.
+_FIELD_DEFAULTS = (
+    ("autoStart", False, bool, True),
+    ("autoRestart", False, bool, True),   # monitor/restart on unexpected exit
+    ("waitTimeout", 0, int, False),
+    ("waitInterval", 2, int, False),
+)
+
+# Shape of a well-formed launch.conf. The validator fills the "default" entries, so a document
+# that passes needs no further work; anything else goes through the lenient _FIELD_DEFAULTS
+# pass so hand-edited files still load.
+_CONF_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "profiles": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "kind": {"enum": ["Process", "Title"]},
+                    "value": {"type": "string"},
+                    "monitor": {"type": "integer"},
+                    "path": {"type": "string"},
+                    "args": {"type": "string"},
+                    "waitTarget": {"type": "string"},
+                    "waitTimeout": {"type": "integer", "minimum": 0},
+                    "waitInterval": {"type": "integer", "minimum": 1},
+                    "autoStart": {"type": "boolean", "default": False},
+                    "autoRestart": {"type": "boolean", "default": False},
+                },
+            },
+        },
+    },
+}
+
+
+def _compile_conf_validator():
+    # Built once at import; returns a callable(data) -> bool that also fills schema defaults
+    # in place, or None without a schema library
+    if FASTJSONSCHEMA_AVAILABLE:
+        validate = fastjsonschema.compile(_CONF_SCHEMA, use_default=True)
+
+        def _check(data):
+            try:
+                validate(data)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+        return _check
+    if JSONSCHEMA_AVAILABLE:
+        check_properties = jsonschema.Draft7Validator.VALIDATORS["properties"]
+
+        def _properties_with_defaults(validator, properties, instance, schema):
+            if isinstance(instance, dict):
+                for prop, subschema in properties.items():
+                    if "default" in subschema:
+                        instance.setdefault(prop, subschema["default"])
+            yield from check_properties(validator, properties, instance, schema)
+
+        filling = jsonschema.validators.extend(
+            jsonschema.Draft7Validator, {"properties": _properties_with_defaults}
+        )
+        return filling(_CONF_SCHEMA).is_valid
+    return None
+
+
+_CONF_VALIDATOR = _compile_conf_validator()
+
+
+def _normalize_profiles(profiles):
+    for p in profiles:
+        for field, default, cast, always in _FIELD_DEFAULTS:
+            if not always and field not in p:
+                continue
+            try:
+                p[field] = cast(p.get(field) or default)
+            except Exception:
+                p[field] = default
+
+
+@functools.lru_cache(maxsize=64)
+def _split_args(args: str) -> tuple:
+    # Tokenize once per distinct args string so restarts reuse the result; quoted
+    # arguments stay whole. Windows paths keep their backslashes (non-POSIX mode).
+    if os.name == "nt":
+        return tuple(
+            a[1:-1] if len(a) >= 2 and a[0] == a[-1] and a[0] in "\"'" else a
+            for a in shlex.split(args, posix=False)
+        )
+    return tuple(shlex.split(args))
+
+
+def _socket_probe_addr(target: str):
+    """(host, port) for tcp:// and http(s):// targets, which only need a TCP connect.
+
+    Redis (PING handshake), ping:// and bare host targets return None and are left to
+    launcher._can_reach.
+    """
+    try:
+        parsed = urlparse(target)
+        if parsed.scheme == "tcp" and parsed.hostname and parsed.port:
+            return parsed.hostname, parsed.port
+        if parsed.scheme in ("http", "https") and parsed.hostname:
+            return parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80)
+    except Exception:
+        pass
+    return None
+
+
+async def _connect_probe(host: str, port: int, timeout: float) -> bool:
+    try:
+        _reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except Exception:
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except Exception:
+        pass
+    return True
+
+
+async def _connect_probe_all(addrs, timeout: float):
+    return await asyncio.gather(*(_connect_probe(host, port, timeout) for host, port in addrs))
+
+
+@functools.lru_cache(maxsize=64)
+def _strip_exe(value: str):
+    # Process name without a (case-insensitive) .exe suffix, or None if there is none
+    return value[:-4] if value[-4:].lower() == ".exe" else None
 
 
 def load_profiles():
     if not CONF_PATH.exists():
         return {"profiles": []}
     try:
-        with CONF_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(CONF_PATH.read_bytes())
         if not isinstance(data, dict):
             return {"profiles": []}
         data.setdefault("profiles", [])
-        # normalize booleans and defaults
-        for p in data.get("profiles", []):
-            try:
-                p["autoStart"] = bool(p.get("autoStart", False))
-            except Exception:
-                p["autoStart"] = False
-            # monitor/restart on unexpected exit
-            try:
-                p["autoRestart"] = bool(p.get("autoRestart", False))
-            except Exception:
-                p["autoRestart"] = False
-            # optional connectivity wait fields
-            if "waitTimeout" in p:
-                try:
-                    p["waitTimeout"] = int(p.get("waitTimeout") or 0)
-                except Exception:
-                    p["waitTimeout"] = 0
-            if "waitInterval" in p:
-                try:
-                    p["waitInterval"] = int(p.get("waitInterval") or 2)
-                except Exception:
-                    p["waitInterval"] = 2
+        # A valid document comes back with its defaults filled in; only the rest needs coercing
+        if _CONF_VALIDATOR is None or not _CONF_VALIDATOR(data):
+            # normalize booleans and defaults
+            _normalize_profiles(data.get("profiles", []))
         return data
     except Exception:
         return {"profiles": []}
@@ -62,8 +219,10 @@ def load_profiles():
 def save_profiles(data: dict):
     data = data or {"profiles": []}
     data.setdefault("profiles", [])
-    with CONF_PATH.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Write a sibling temp file and swap it in, so a crash mid-write never leaves a truncated config
+    tmp = CONF_PATH.with_suffix(".conf.tmp")
+    tmp.write_bytes(_json_dumps(data))
+    os.replace(tmp, CONF_PATH)
 
 
 class ProfileEditor(tk.Toplevel):
@@ -154,6 +313,7 @@ class ProfileEditor(tk.Toplevel):
             ("Executable", "*.exe *.bat *.cmd"),
             ("All Files", "*.*"),
         ]
+        from tkinter import filedialog  # only needed once the user clicks Browse
         filename = filedialog.askopenfilename(title="Select Executable", initialdir=initdir, filetypes=filetypes)
         if filename:
             self.var_path.set(filename)
@@ -212,11 +372,30 @@ class ProfilesApp(tk.Tk):
         self.data = load_profiles()
         self.processes = {}  # name -> subprocess.Popen
         self.conn_status = {}  # name -> "Online"/"Offline"/"Waiting..."/"-"
+        self._conn_dirty = set()  # names whose conn status changed since the last tree refresh
+        self._conn_lock = threading.Lock()
+        # Probes run concurrently so one slow target does not hold up the others
+        self._conn_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="conn-probe")
+        # TCP connect probes all run on one event loop thread
+        self._probe_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._probe_loop.run_forever, daemon=True).start()
+        # Window re-moves for already-running apps are handed to one long-lived worker
+        self._move_queue = queue.Queue()
+        threading.Thread(target=self._move_worker, daemon=True).start()
         self._stop_event = threading.Event()
         # Auto-restart/monitoring helpers
         self._user_stop_flags = {}   # name -> True if user requested stop via UI
         self._launching = set()      # names currently in launching flow to avoid duplicates
         self._last_restart = {}      # name -> last restart timestamp to avoid thrashing
+        # Guards processes/_launching/_user_stop_flags/_last_restart, which launch runners touch off the Tk thread
+        self._state_lock = threading.Lock()
+        self._restartable_profiles = []  # autoRestart profiles with a path; rebuilt when the profile list changes
+        # Status line: latest message wins and is rendered at most once per idle cycle
+        self._pending_status = None
+        self._status_scheduled = False
+        self._status_lock = threading.Lock()
+        self._drain_delay = CONN_DRAIN_MS  # current _drain_conn_updates interval (Tk thread only)
+        self._drain_after_id = None
 
         self._build_menu()
         self._build_main()
@@ -226,8 +405,9 @@ class ProfilesApp(tk.Tk):
         self.after(200, self._auto_start_profiles)
         # Background connectivity monitor
         threading.Thread(target=self._conn_monitor, daemon=True).start()
-        # Background process monitor (auto-restart on crash)
-        threading.Thread(target=self._proc_monitor, daemon=True).start()
+        # Process monitor (auto-restart on crash) and connectivity column refresh run on the Tk loop
+        self.after(PROC_TICK_MS, self._proc_tick)
+        self._drain_after_id = self.after(CONN_DRAIN_MS, self._drain_conn_updates)
         # Window close hook
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -311,38 +491,60 @@ class ProfilesApp(tk.Tk):
         self.bind_all("<Control-s>", lambda e: self.on_save())
 
     def _load_table(self):
+        """Full rebuild; used for the initial population. CRUD handlers update single rows."""
         for i in self.tree.get_children():
             self.tree.delete(i)
+        # name -> profile index used by the selection handlers (same key as the row iid)
+        self._by_name = {p.get("name", p.get("value")): p for p in self.data.get("profiles", [])}
         for prof in self.data.get("profiles", []):
             name = prof.get("name", prof.get("value"))
-            # Initialize connection status
-            if prof.get("waitTarget"):
-                self.conn_status[name] = self.conn_status.get(name, "-")
-            else:
-                self.conn_status[name] = "-"
-            self.tree.insert("", "end", iid=prof.get("name", prof.get("value")), values=(
-                prof.get("name", ""),
-                prof.get("kind", "Process"),
-                prof.get("value", ""),
-                prof.get("monitor", 1),
-                prof.get("path", ""),
-                "Yes" if prof.get("autoStart") else "No",
-                self.conn_status.get(name, "-"),
-            ))
-        # Initial refresh of connection column
-        self.after(100, self._apply_conn_status_to_tree)
+            self._init_conn_status(name, prof)
+            self.tree.insert("", "end", iid=name, values=self._row_values(prof))
+        self._refresh_restartable()
+
+    def _refresh_restartable(self):
+        # Only profiles launched from a path can be restarted by _proc_tick
+        restartable = [
+            p for p in self.data.get("profiles", [])
+            if p.get("autoRestart") and (p.get("path") or "").strip()
+        ]
+        with self._state_lock:
+            self._restartable_profiles = restartable
+
+    def _init_conn_status(self, name, prof):
+        # Initialize connection status
+        if prof.get("waitTarget"):
+            self.conn_status[name] = self.conn_status.get(name, "-")
+        else:
+            self.conn_status[name] = "-"
+
+    def _row_values(self, prof):
+        g = prof.get
+        name = g("name", g("value"))
+        return (
+            g("name", ""),
+            g("kind", "Process"),
+            g("value", ""),
+            g("monitor", 1),
+            g("path", ""),
+            "Yes" if g("autoStart") else "No",
+            self.conn_status.get(name, "-"),
+        )
 
     def on_add(self):
         dlg = ProfileEditor(self)
         self.wait_window(dlg)
         if dlg.result:
             # unique by name
-            names = {p.get("name") for p in self.data.get("profiles", [])}
-            if dlg.result["name"] in names:
+            name = dlg.result["name"]
+            if name in self._by_name:
                 messagebox.showerror("Error", "Name already exists.")
                 return
             self.data.setdefault("profiles", []).append(dlg.result)
-            self._load_table()
+            self._by_name[name] = dlg.result
+            self._init_conn_status(name, dlg.result)
+            self.tree.insert("", "end", iid=name, values=self._row_values(dlg.result))
+            self._refresh_restartable()
 
     def on_edit(self):
         sel = self.tree.selection()
@@ -350,7 +552,7 @@ class ProfilesApp(tk.Tk):
             messagebox.showinfo("Info", "Please select a profile first.")
             return
         name = sel[0]
-        prof = next((p for p in self.data.get("profiles", []) if p.get("name") == name), None)
+        prof = self._by_name.get(name)
         if not prof:
             messagebox.showerror("Error", "Profile not found.")
             return
@@ -358,19 +560,34 @@ class ProfilesApp(tk.Tk):
         self.wait_window(dlg)
         if dlg.result:
             # replace
-            for i, p in enumerate(self.data.get("profiles", [])):
-                if p.get("name") == name:
-                    self.data["profiles"][i] = dlg.result
-                    break
-            self._load_table()
+            new_prof = dlg.result
+            new_name = new_prof["name"]
+            profiles = self.data["profiles"]
+            profiles[profiles.index(prof)] = new_prof
+            del self._by_name[name]
+            self._by_name[new_name] = new_prof
+            self._init_conn_status(new_name, new_prof)
+            if new_name == name:
+                self.tree.item(name, values=self._row_values(new_prof))
+            else:
+                # Renamed: the iid is the name, so swap the row in place
+                index = self.tree.index(name)
+                self.tree.delete(name)
+                self.conn_status.pop(name, None)
+                self.tree.insert("", index, iid=new_name, values=self._row_values(new_prof))
+            self._refresh_restartable()
 
     def on_delete(self):
         sel = self.tree.selection()
         if not sel:
             return
         name = sel[0]
-        self.data["profiles"] = [p for p in self.data.get("profiles", []) if p.get("name") != name]
-        self._load_table()
+        prof = self._by_name.pop(name, None)
+        if prof is not None:
+            self.data["profiles"].remove(prof)
+        self.conn_status.pop(name, None)
+        self.tree.delete(name)
+        self._refresh_restartable()
 
     def on_save(self):
         try:
@@ -381,6 +598,7 @@ class ProfilesApp(tk.Tk):
 
     # Start/stop logic
     def _start_profile(self, prof: dict):
+        import launcher  # deferred so the window paints before ctypes/win32 setup is loaded
         name = prof.get("name", prof.get("value"))
         path = (prof.get("path") or "").strip()
         args = (prof.get("args") or "").strip()
@@ -392,32 +610,38 @@ class ProfilesApp(tk.Tk):
         wait_interval = int(prof.get("waitInterval", 2) or 2)
 
         # Prevent duplicate launches: if process is already running, just attempt move
-        existing = self.processes.get(name)
+        with self._state_lock:
+            existing = self.processes.get(name)
         if existing and getattr(existing, 'poll', lambda: None)() is None:
             # If already running, optionally re-move the window and return
-            threading.Thread(
-                target=lambda: launcher.move_window_with_multimonitor(
-                    monitor, kind, value, retries=20, delay=0.5
-                ),
-                daemon=True,
-            ).start()
-            return
-        if name in self._launching:
+            self._move_queue.put(
+                lambda: launcher.move_window_with_multimonitor(monitor, kind, value, retries=20, delay=0.5)
+            )
             return
-
-        def runner():
+        # Claimed before dispatch so a second click or restart tick cannot queue a duplicate
+        with self._state_lock:
+            if name in self._launching:
+                return
             self._launching.add(name)
             # Clear any prior user-stop flag since we're explicitly starting now
             self._user_stop_flags[name] = False
+
+        def finish():
+            with self._state_lock:
+                self._launching.discard(name)
+
+        def runner():
             # Optional: wait for connectivity before launch
             if wait_target:
-                self.status.set(f"Waiting for connectivity: {wait_target} ...")
+                self._set_status(f"Waiting for connectivity: {wait_target} ...")
                 self._set_conn_status(name, "Waiting...")
-                ok_conn = launcher.wait_for_connectivity(wait_target, total_timeout=wait_timeout, interval=wait_interval)
+                ok_conn = launcher.wait_for_connectivity(
+                    wait_target, total_timeout=wait_timeout, interval=wait_interval, cancel_event=self._stop_event
+                )
                 if not ok_conn:
-                    self.status.set(f"Connectivity failed/timeout: {wait_target}")
+                    self._set_status(f"Connectivity failed/timeout: {wait_target}")
                     self._set_conn_status(name, "Offline")
-                    self._launching.discard(name)
+                    finish()
                     return
                 else:
                     self._set_conn_status(name, "Online")
@@ -425,35 +649,85 @@ class ProfilesApp(tk.Tk):
             proc = None
             if path:
                 try:
-                    cmd = [path] + ([a for a in args.split() if a] if args else [])
-                    proc = subprocess.Popen(cmd, cwd=str(Path(path).parent))
-                    self.processes[name] = proc
+                    cmd = [path, *_split_args(args)]
+                    kwargs = {"cwd": str(Path(path).parent), "close_fds": True}
+                    if sys.platform == "win32":
+                        # Own process group so our console's Ctrl+C doesn't reach it; the console itself is
+                        # kept (DETACHED_PROCESS would leave console programs and .bat/.cmd files without one)
+                        kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+                    proc = subprocess.Popen(cmd, **kwargs)
+                    with self._state_lock:
+                        self.processes[name] = proc
                 except Exception as e:
-                    self.status.set(f"Launch failed: {name}: {e}")
-                    self._launching.discard(name)
+                    self._set_status(f"Launch failed: {name}: {e}")
+                    finish()
                     return
             # Move window
             if proc is not None:
                 launcher.wait_for_window_of_process(proc.pid, timeout=15.0, poll=0.5)
             ok_move = launcher.move_window_with_multimonitor(monitor, kind, value, retries=40, delay=0.5)
-            if not ok_move and kind == "Process" and value.endswith(".exe"):
-                launcher.move_window_with_multimonitor(monitor, kind, value[:-4], retries=20, delay=0.5)
-            self.status.set(f"Window move complete: {name}")
-            self._launching.discard(name)
-
+            if not ok_move and kind == "Process":
+                bare = _strip_exe(value)
+                if bare:
+                    launcher.move_window_with_multimonitor(monitor, kind, bare, retries=20, delay=0.5)
+            self._set_status(f"Window move complete: {name}")
+            finish()
+
+        if self._stop_event.is_set():
+            # window closing
+            finish()
+            return
         threading.Thread(target=runner, daemon=True).start()
+        # The runner reports progress right away; don't leave it waiting on a backed-off drain
+        self._wake_drain()
+
+    def _set_status(self, msg: str):
+        with self._status_lock:
+            self._pending_status = msg
+        # Worker threads must not touch Tk; their messages are flushed by _drain_conn_updates
+        if threading.current_thread() is threading.main_thread() and not self._status_scheduled:
+            self._status_scheduled = True
+            self.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        self._status_scheduled = False
+        with self._status_lock:
+            msg = self._pending_status
+            self._pending_status = None
+        if msg is not None:
+            self.status.set(msg)
+
+    def _move_worker(self):
+        # Blocks until there is work; _on_close puts None to stop it
+        while True:
+            fn = self._move_queue.get()
+            if fn is None:
+                return
+            try:
+                fn()
+            except Exception:
+                pass
+
+    def _mark_conn_status(self, name: str, value: str) -> bool:
+        """Record a status change for the next tree refresh; returns False if unchanged."""
+        with self._conn_lock:
+            if self.conn_status.get(name) == value:
+                return False
+            self.conn_status[name] = value
+            self._conn_dirty.add(name)
+            return True
 
     def _set_conn_status(self, name: str, value: str):
-        self.conn_status[name] = value
-        # Apply to UI (main thread)
-        try:
-            self.after(0, self._apply_conn_status_to_tree)
-        except Exception:
-            pass
+        # Applied to the UI by _drain_conn_updates on the main thread
+        self._mark_conn_status(name, value)
 
     def _apply_conn_status_to_tree(self):
-        for name, status in list(self.conn_status.items()):
-            if name in self.tree.get_children():
+        with self._conn_lock:
+            dirty = self._conn_dirty
+            self._conn_dirty = set()
+            updates = [(name, self.conn_status.get(name, "-")) for name in dirty]
+        for name, status in updates:
+            if self.tree.exists(name):
                 try:
                     self.tree.set(name, column="conn", value=status)
                 except Exception:
@@ -461,22 +735,46 @@ class ProfilesApp(tk.Tk):
 
     def _conn_monitor(self):
     # Periodically check connectivity for profiles with waitTarget
+        import launcher
         while not self._stop_event.is_set():
             try:
+                futures = {}
+                socket_names, socket_addrs = [], []
                 for prof in list(self.data.get("profiles", [])):
                     name = prof.get("name", prof.get("value"))
                     wt = (prof.get("waitTarget") or "").strip()
                     if not wt:
                         continue
-                    ok = False
-                    try:
+                    addr = _socket_probe_addr(wt)
+                    if addr is not None:
+                        socket_names.append(name)
+                        socket_addrs.append(addr)
+                    else:
                         # Single connectivity probe (non-blocking loop)
-                        ok = launcher._can_reach(wt)
+                        futures[self._conn_pool.submit(launcher._can_reach, wt)] = name
+                gathered = None
+                if socket_addrs:
+                    gathered = asyncio.run_coroutine_threadsafe(
+                        _connect_probe_all(socket_addrs, CONN_CONNECT_TIMEOUT), self._probe_loop
+                    )
+                try:
+                    for fut in as_completed(futures, timeout=CONN_CYCLE_TIMEOUT):
+                        try:
+                            ok = fut.result()
+                        except Exception:
+                            ok = False
+                        self._mark_conn_status(futures[fut], "Online" if ok else "Offline")
+                except Exception:
+                    # Timed out: keep the results that did arrive; stragglers report next cycle
+                    pass
+                if gathered is not None:
+                    try:
+                        results = gathered.result(timeout=CONN_CYCLE_TIMEOUT)
                     except Exception:
-                        ok = False
-                    self.conn_status[name] = "Online" if ok else "Offline"
-                # 推送到UI
-                self.after(0, self._apply_conn_status_to_tree)
+                        gathered.cancel()
+                        results = ()
+                    for name, ok in zip(socket_names, results):
+                        self._mark_conn_status(name, "Online" if ok else "Offline")
             except Exception:
                 pass
             # Sleep between refresh cycles
@@ -486,55 +784,59 @@ class ProfilesApp(tk.Tk):
                 time.sleep(0.5)
 
     def _on_close(self):
+        import launcher
     # Signal background threads to stop
         try:
             self._stop_event.set()
+            self._move_queue.put(None)
+            self._conn_pool.shutdown(wait=False, cancel_futures=True)
+            self._probe_loop.call_soon_threadsafe(self._probe_loop.stop)
         except Exception:
             pass
     # Mark all running apps as user-stopped and terminate them
         try:
-            for name, p in list(self.processes.items()):
-                try:
+            with self._state_lock:
+                running = list(self.processes.items())
+                self.processes.clear()
+                for name, _p in running:
                     self._user_stop_flags[name] = True
-                except Exception:
-                    pass
+            for name, p in running:
                 try:
                     if p and getattr(p, 'poll', lambda: None)() is None:
                         launcher.terminate_process_tree(p)
                 except Exception:
                     pass
-            self.processes.clear()
         except Exception:
             pass
         # Close window
         self.destroy()
 
     def _stop_profile(self, prof: dict):
+        import launcher
         name = prof.get("name", prof.get("value"))
     # Mark as user-stopped to avoid auto-restart
-        self._user_stop_flags[name] = True
-        p = self.processes.get(name)
+        with self._state_lock:
+            self._user_stop_flags[name] = True
+            p = self.processes.pop(name, None)
         if p and p.poll() is None:
             try:
                 launcher.terminate_process_tree(p)
             except Exception:
                 pass
-        self.processes.pop(name, None)
 
-    def _proc_monitor(self):
-    # Monitor autoRestart profiles and restart if unexpectedly exited
-        while not self._stop_event.is_set():
-            try:
-                now = time.time()
-                for prof in list(self.data.get("profiles", [])):
-                    try:
-                        if not prof.get("autoRestart"):
-                            continue
-                        path = (prof.get("path") or "").strip()
-                        if not path:
-                            # Only monitor processes started by this launcher
-                            continue
-                        name = prof.get("name", prof.get("value"))
+    def _proc_tick(self):
+        # Monitor autoRestart profiles and restart if unexpectedly exited.
+        # poll() does not block, so this runs on the Tk loop instead of a dedicated thread.
+        if self._stop_event.is_set():
+            return
+        try:
+            now = time.time()
+            with self._state_lock:
+                restartable = self._restartable_profiles
+            for prof in restartable:
+                try:
+                    name = prof.get("name", prof.get("value"))
+                    with self._state_lock:
                         # Skip if currently launching to avoid dups
                         if name in self._launching:
                             continue
@@ -554,24 +856,45 @@ class ProfilesApp(tk.Tk):
                             continue
                         # Relaunch
                         self._last_restart[name] = now
-                        self.status.set(f"Detected exit, restarting: {name}")
-                        self._start_profile(prof)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            # Sleep a bit
-            for _ in range(6):
-                if self._stop_event.is_set():
-                    break
-                time.sleep(0.5)
+                    self._set_status(f"Detected exit, restarting: {name}")
+                    self._start_profile(prof)
+                except Exception:
+                    pass
+        except Exception:
+            pass
+        self.after(PROC_TICK_MS, self._proc_tick)
+
+    def _wake_drain(self):
+        """Tk thread only: bring the drain back to its fast interval."""
+        self._drain_delay = CONN_DRAIN_MS
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+        self._drain_after_id = self.after(CONN_DRAIN_MS, self._drain_conn_updates)
+
+    def _drain_conn_updates(self):
+        # Connectivity results and status messages are recorded by worker threads; render them from the Tk loop.
+        # Backs off while nothing changes so an idle window rarely wakes up.
+        self._drain_after_id = None
+        if self._stop_event.is_set():
+            return
+        with self._conn_lock:
+            changed = bool(self._conn_dirty)
+        with self._status_lock:
+            changed = changed or self._pending_status is not None
+        if changed:
+            self._apply_conn_status_to_tree()
+            self._flush_status()
+            self._drain_delay = CONN_DRAIN_MS
+        else:
+            self._drain_delay = min(self._drain_delay * 2, CONN_DRAIN_IDLE_MS)
+        self._drain_after_id = self.after(self._drain_delay, self._drain_conn_updates)
 
     def on_start_selected(self):
         sel = self.tree.selection()
         if not sel:
             return
         name = sel[0]
-        prof = next((p for p in self.data.get("profiles", []) if p.get("name") == name), None)
+        prof = self._by_name.get(name)
         if prof:
             self._start_profile(prof)
 
@@ -580,7 +903,7 @@ class ProfilesApp(tk.Tk):
         if not sel:
             return
         name = sel[0]
-        prof = next((p for p in self.data.get("profiles", []) if p.get("name") == name), None)
+        prof = self._by_name.get(name)
         if prof:
             self._stop_profile(prof)
 
@@ -607,10 +930,10 @@ class ProfilesApp(tk.Tk):
                         self._start_profile(prof)
                 except Exception:
                     pass
-            self.status.set("Auto start complete")
+            self._set_status("Auto start complete")
         except Exception:
             # keep UI resilient even if auto start has issues
-            self.status.set("Auto start complete (with errors)")
+            self._set_status("Auto start complete (with errors)")
 
 
 if __name__ == "__main__":
@@ -2,8 +2,17 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 from pathlib import Path
 import json
+import os
+import functools
+import random
+import shlex
+import signal
 import threading
+import queue
 import subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
 import time
 import sys
 import socket
@@ -16,6 +25,18 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
 """
 Simplified cross-platform launcher GUI.
 Removes process/title matching and window moving logic (MultiMonitorTool dependent).
@@ -23,7 +44,7 @@ Each profile describes an executable to run with optional arguments. Optional fi
   - group: string tag to group related apps
   - order: integer launch order within the group (lower first)
   - path: absolute/relative path to executable/script
-  - args: optional argument string (split on whitespace)
+  - args: optional argument string (split shell-style; quote arguments containing spaces)
   - autoStart: bool, whether to auto start on app launch
   - autoRestart: bool, if process exits unexpectedly, restart
   - waitTarget: optional connectivity target before launching; examples:
@@ -32,6 +53,10 @@ Each profile describes an executable to run with optional arguments. Optional fi
         127.0.0.1:6379   (TCP host:port)
   - waitTimeout: total seconds to wait for connectivity (0 => no wait)
   - waitInterval: interval seconds between probes (default 2)
+  - waitConnectTimeout: seconds allowed for each probe's TCP connect (default 1.5)
+  - waitExpectStatus: HTTP statuses that count as reachable for http(s) targets,
+        e.g. "2xx" (default), "2xx,3xx" or "200,204"; redirects are followed first,
+        so the status checked is that of the final response
 
 Launch ordering: "Start All" will sort profiles by (group, order, name).
 Connectivity column reflects current reachability of waitTarget if defined.
@@ -59,6 +84,25 @@ def _resolve_base_dir() -> Path:
 BASE_DIR = _resolve_base_dir()
 CONF_PATH = BASE_DIR / "launch.conf"
 CRASH_LOG_PATH = BASE_DIR / "crash_log.txt"
+CONN_POLL_INTERVAL = 3.0    # seconds between connectivity sweeps while statuses are changing
+CONN_POLL_MAX = 16.0        # sweeps back off (doubling) up to this while nothing changes
+CONN_SWEEP_TIMEOUT = 15     # seconds to wait for one round of connectivity probes
+CONN_PROBE_WORKERS = 16     # probes in flight per sweep across all hosts
+CONN_PROBES_PER_HOST = 2    # concurrent probes allowed against the same endpoint
+DEFAULT_CONNECT_TIMEOUT = 1.5  # per-probe connect timeout unless the profile sets waitConnectTimeout
+DNS_CACHE_TTL = 900         # seconds a resolved probe address is reused (dropped early when it stops answering)
+HTTP_READ_TIMEOUT = 3.0     # seconds an http probe waits for the response once connected
+HTTP_MAX_REDIRECTS = 10     # redirects an http probe follows (urllib's own limit) before judging the status
+WAIT_MODES = ("tcp", "http")  # waitMode: "tcp" = port accepts connections, "http" = also an accepted status
+REACH_CACHE_TTL = 0.5       # seconds a probe result is reused by back-to-back callers
+REDIS_RECONCILE_INTERVAL = 10  # with keyspace notifications, full re-check of redis groups this often
+REDIS_POLL_INTERVAL = 0.5   # without them, keys are polled this often after a change...
+REDIS_POLL_MAX = 8.0        # ...backing off (doubling) up to this while nothing changes
+UI_PUMP_MS = 30             # how often worker-thread UI requests are applied on the Tk thread
+UI_PUMP_BATCH = 200         # max queued UI requests handled per pump tick
+TREE_FLUSH_MS = 60          # status/conn column updates are coalesced into one pass per frame
+SEQUENCE_WORKERS = 4        # concurrent start-all/group/auto-start sequences
+TABLE_PAGE_SIZE = 50        # profile rows inserted per batch; more are added as the list scrolls to the end
 
 # ---------------- Crash Logging -----------------
 
@@ -82,48 +126,187 @@ def log_crash(app_name: str, executable_path: str, termination_type: str = "unex
     except Exception:
         pass  # Silent fail to not disrupt monitoring
 
+# ---------------- Process Control -----------------
+
+def _signal_app(proc, kill: bool = False):
+    """terminate() (or kill()) a launched app. On POSIX apps lead their own session
+    (start_new_session), so the whole process group is signalled and helpers the app
+    spawned, e.g. behind a wrapper script, go down with it."""
+    if sys.platform != "win32":
+        try:
+            os.killpg(proc.pid, signal.SIGKILL if kill else signal.SIGTERM)
+            return
+        except Exception:
+            pass
+    if kill:
+        proc.kill()
+    else:
+        proc.terminate()
+
 # ---------------- Persistence -----------------
 
+def _json_loads(raw: bytes):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data) -> bytes:
+    # Both paths emit 2-space indented UTF-8 with non-ASCII characters kept as-is
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _strip_str(v, default):
+    return str(default if v is None else v).strip()
+
+
+def _intern_str(v, default):
+    # group names key every per-group map; one shared object per name makes those lookups identity hits
+    return sys.intern(_strip_str(v, default))
+
+
+def _as_int(v, default):
+    # falsy (missing/0/"") -> default, as before; plain types convert without a try block
+    if not v:
+        return default
+    if isinstance(v, (int, float)):
+        return int(v)
+    if isinstance(v, str):
+        v = v.strip()
+        if v.lstrip("-").isdigit():
+            return int(v)
+    return default
+
+
+def _as_float(v, default):
+    if not v:
+        return default
+    if isinstance(v, (int, float)):
+        return float(v)
+    try:
+        return float(v)
+    except Exception:
+        return default
+
+
+def _as_bool(v, default):
+    return bool(v)
+
+
+def _as_status_spec(v, default):
+    if isinstance(v, (list, tuple)):
+        v = ",".join(str(x) for x in v)
+    return str(v or default).strip()
+
+
+def _as_wait_mode(v, default):
+    v = str(v or "").strip().lower()
+    return v if v in WAIT_MODES else default
+
+
+@functools.lru_cache(maxsize=64)
+def _split_args(args: str) -> tuple:
+    # Tokenize once per distinct args string so restarts reuse the result; quoted
+    # arguments stay whole. Windows paths keep their backslashes (non-POSIX mode).
+    if os.name == "nt":
+        return tuple(
+            a[1:-1] if len(a) >= 2 and a[0] == a[-1] and a[0] in "\"'" else a
+            for a in shlex.split(args, posix=False)
+        )
+    return tuple(shlex.split(args))
+
+
+@functools.lru_cache(maxsize=64)
+def _app_cwd(path: str) -> str:
+    # Apps start in their own directory; computed once per path, not per (re)start
+    return str(Path(path).parent)
+
+
+# Profile fields in file order: (field, default, coercer). "name" is resolved separately.
+_PROFILE_FIELDS = (
+    ("group", "", _intern_str),
+    ("order", 0, _as_int),
+    ("path", "", _strip_str),
+    ("args", "", _strip_str),
+    ("autoStart", False, _as_bool),
+    ("autoRestart", False, _as_bool),
+    # connectivity
+    ("waitTarget", "", _strip_str),
+    ("waitTimeout", 0, _as_int),
+    ("waitInterval", 2, _as_int),
+    ("waitConnectTimeout", DEFAULT_CONNECT_TIMEOUT, _as_float),
+    ("waitExpectStatus", "2xx", _as_status_spec),
+    ("waitMode", "tcp", _as_wait_mode),
+    ("postLaunchDelay", 0, _as_int),
+)
+
+
+def _as_list(v, default):
+    return list(v) if isinstance(v, (list, tuple)) else list(default)
+
+
+def _as_dict(v, default):
+    return v if isinstance(v, dict) else dict(default)
+
+
+# Top-level launch.conf settings: (key, default, coercer)
+_SETTINGS_FIELDS = (
+    # group auto-start override
+    ("autoStartGroups", [], _as_list),
+    ("autoStartGroupsOverride", False, _as_bool),
+    # Group modes: {group_name: {"mode": "on"|"off"|"redis", "redisKey": "key:field"}}
+    ("groupModes", {}, _as_dict),
+    # Redis
+    ("redisHost", "localhost", _strip_str),
+    ("redisPort", 6379, _as_int),
+    ("redisDb", 0, _as_int),
+    ("redisPassword", "", _strip_str),
+)
+
+
+def _normalize_settings(data: dict) -> dict:
+    """Fill in and type the top-level settings in place so readers can index them directly."""
+    for key, default, coerce in _SETTINGS_FIELDS:
+        data[key] = coerce(data.get(key, default), default)
+    if not data["redisHost"]:
+        data["redisHost"] = "localhost"
+    return data
+
+
+def _normalize_profile(raw: dict) -> dict:
+    p = {"name": sys.intern(str(raw.get("name") or raw.get("value") or raw.get("path") or "Unnamed"))}
+    get = raw.get
+    for field, default, coerce in _PROFILE_FIELDS:
+        p[field] = coerce(get(field, default), default)
+    return p
+
+
+def _profile_sort_key(p):
+    # profiles are normalized on load/edit, so the fields are already typed
+    return (p["group"], p["order"], p["name"])
+
+
+def _coerce_profile_ints(prof: dict) -> dict:
+    """Coerce prof's numeric fields in place, as load_profiles does, so launch code can index them directly.
+    Name and group are interned the same way too."""
+    for field, default, coerce in _PROFILE_FIELDS:
+        if coerce is _as_int or coerce is _as_float or coerce is _intern_str:
+            prof[field] = coerce(prof.get(field, default), default)
+    prof["name"] = sys.intern(prof["name"])
+    return prof
+
+
 def load_profiles():
     if not CONF_PATH.exists():
         return {"profiles": []}
     try:
-        with CONF_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(CONF_PATH.read_bytes())
         if not isinstance(data, dict):
             return {"profiles": []}
         data.setdefault("profiles", [])
-        normalized = []
-        for raw in data.get("profiles", []):
-            if not isinstance(raw, dict):
-                continue
-            p = {}
-            p["name"] = raw.get("name") or raw.get("value") or raw.get("path") or "Unnamed"
-            p["group"] = str(raw.get("group", "")).strip()
-            try:
-                p["order"] = int(raw.get("order", 0) or 0)
-            except Exception:
-                p["order"] = 0
-            p["path"] = str(raw.get("path", "")).strip()
-            p["args"] = str(raw.get("args", "")).strip()
-            p["autoStart"] = bool(raw.get("autoStart", False))
-            p["autoRestart"] = bool(raw.get("autoRestart", False))
-            # connectivity
-            p["waitTarget"] = str(raw.get("waitTarget", "")).strip()
-            try:
-                p["waitTimeout"] = int(raw.get("waitTimeout", 0) or 0)
-            except Exception:
-                p["waitTimeout"] = 0
-            try:
-                p["waitInterval"] = int(raw.get("waitInterval", 2) or 2)
-            except Exception:
-                p["waitInterval"] = 2
-            try:
-                p["postLaunchDelay"] = int(raw.get("postLaunchDelay", 0) or 0)
-            except Exception:
-                p["postLaunchDelay"] = 0
-            normalized.append(p)
-        data["profiles"] = normalized
+        data["profiles"] = [_normalize_profile(raw) for raw in data.get("profiles", []) if isinstance(raw, dict)]
         return data
     except Exception:
         return {"profiles": []}
@@ -132,65 +315,227 @@ def load_profiles():
 def save_profiles(data: dict):
     data = data or {"profiles": []}
     data.setdefault("profiles", [])
-    with CONF_PATH.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Write a sibling temp file and swap it in: an interrupted save never leaves a torn launch.conf
+    tmp = CONF_PATH.with_suffix(".conf.tmp")
+    with tmp.open("wb") as f:
+        f.write(_json_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, CONF_PATH)
 
 # ---------------- Connectivity -----------------
 
-def _is_http_target(target: str) -> bool:
-    return target.startswith("http://") or target.startswith("https://")
-
-
-def _is_tcp_target(target: str) -> bool:
-    if ":" not in target:
-        return False
+# Shared keep-alive pool for http(s) probes so repeated polls skip the TCP/TLS handshake.
+# No retries, but redirects are followed like the urllib fallback does, so both paths judge the same response.
+_HTTP_POOL = (
+    urllib3.PoolManager(num_pools=32, maxsize=4,
+                        retries=urllib3.Retry(total=None, connect=0, read=0, status=0,
+                                              redirect=HTTP_MAX_REDIRECTS, raise_on_redirect=False),
+                        timeout=urllib3.Timeout(connect=DEFAULT_CONNECT_TIMEOUT, read=HTTP_READ_TIMEOUT))
+    if URLLIB3_AVAILABLE else None
+)
+
+@functools.lru_cache(maxsize=64)
+def _parse_target(target: str):
+    """Classify a waitTarget once per distinct string.
+
+    Returns ("http", (host, port) or None) for http(s) URLs, ("tcp", (host, port)) for
+    host:port, or None for anything else.
+    """
+    if target.startswith("http://") or target.startswith("https://"):
+        try:
+            u = urlparse(target)
+            addr = (u.hostname, u.port or (443 if u.scheme == "https" else 80)) if u.hostname else None
+        except Exception:
+            addr = None
+        return ("http", addr)
     host, _, port = target.partition(":")
-    if not host or not port.isdigit():
-        return False
-    return True
-
-
-def _can_reach_http(url: str, timeout: float = 3.0) -> bool:
+    if host and port.isdigit():
+        return ("tcp", (host, int(port)))
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_expect_status(spec: str) -> frozenset:
+    """Turn "2xx", "2xx,3xx" or "200,204" into the set of accepted status codes."""
+    codes = set()
+    for part in (spec or "").split(","):
+        part = part.strip().lower()
+        if len(part) == 3 and part.endswith("xx") and part[0].isdigit():
+            base = int(part[0]) * 100
+            codes.update(range(base, base + 100))
+        elif part.isdigit():
+            codes.add(int(part))
+    return frozenset(codes) or frozenset(range(200, 300))
+
+
+def _http_status(url: str, method: str, timeout: float, headers=None,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT) -> int:
+    """Status code of a bodiless request, or 0 if the server could not be reached."""
+    if _HTTP_POOL is not None:
+        try:
+            r = _HTTP_POOL.request(
+                method, url, headers=headers, preload_content=False, redirect=True,
+                timeout=urllib3.Timeout(connect=min(connect_timeout, timeout), read=timeout),
+            )
+            r.release_conn()
+            return r.status
+        except Exception:
+            return 0
     try:
-        req = urllib.request.Request(url, method="HEAD")
+        req = urllib.request.Request(url, method=method, headers=headers or {})
         with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return 200 <= resp.status < 400
+            return resp.status
     except urllib.error.HTTPError as e:
-        # HTTP error codes still indicate server reachable
-        return 200 <= getattr(e, "code", 0) < 500
+        return getattr(e, "code", 0) or 0
     except Exception:
-        return False
+        return 0
 
 
-def _can_reach_tcp(target: str, timeout: float = 3.0) -> bool:
-    host, _, port = target.partition(":")
+def _can_reach_http(url: str, timeout: float = HTTP_READ_TIMEOUT, expect: str = "2xx",
+                    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT) -> bool:
+    status = _http_status(url, "HEAD", timeout, connect_timeout=connect_timeout)
+    if status in (405, 501):
+        # HEAD not supported: ask for a single byte instead of the whole body
+        status = _http_status(url, "GET", timeout, headers={"Range": "bytes=0-0"}, connect_timeout=connect_timeout)
+    # A 502/503 from a proxy in front of a service that is still starting is not "up"
+    return status in _parse_expect_status(expect)
+
+
+# (host, port) -> (monotonic time, getaddrinfo result)
+_DNS_CACHE = {}
+_DNS_LOCK = threading.Lock()
+
+
+def _resolve(host: str, port: int):
+    key = (host, port)
+    with _DNS_LOCK:
+        hit = _DNS_CACHE.get(key)
+    if hit and time.monotonic() - hit[0] < DNS_CACHE_TTL:
+        return hit[1]
+    # IPv4 first: on dual-stack hosts with broken IPv6 routing the v6 attempt would burn
+    # the whole connect timeout before the working v4 address is tried (sort is stable)
+    addrs = sorted(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM),
+                   key=lambda ai: ai[0] != socket.AF_INET)
+    with _DNS_LOCK:
+        _DNS_CACHE[key] = (time.monotonic(), addrs)
+    return addrs
+
+
+def _can_connect(host: str, port: int, connect_timeout: float, read_timeout: float = 3.0) -> bool:
     try:
-        with socket.create_connection((host, int(port)), timeout=timeout):
-            return True
+        addrs = _resolve(host, port)
     except Exception:
         return False
+    for family, socktype, proto, _, sockaddr in addrs:
+        try:
+            sock = socket.socket(family, socktype, proto)
+        except Exception:
+            continue
+        try:
+            # An unreachable host costs connect_timeout, not the old fixed 3s
+            sock.settimeout(connect_timeout)
+            sock.connect(sockaddr)
+            sock.settimeout(read_timeout)
+            return True
+        except Exception:
+            pass
+        finally:
+            sock.close()
+    # Nothing answered: the host may have moved, so resolve afresh next time
+    with _DNS_LOCK:
+        _DNS_CACHE.pop((host, port), None)
+    return False
+
+
+# (target, expect, connect_timeout, mode, read_timeout) -> (monotonic time, result); shared by the monitor and launch waits
+_REACH_CACHE = {}
+_REACH_LOCK = threading.Lock()
+
 
+def forget_reach(target: str):
+    """Drop cached results for target so the next can_reach probes for real."""
+    with _REACH_LOCK:
+        for key in [k for k in _REACH_CACHE if k[0] == target]:
+            del _REACH_CACHE[key]
 
-def can_reach(target: str) -> bool:
-    if not target:
+
+def can_reach(target: str, expect: str = "2xx", connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+              mode: str = "tcp", read_timeout: float = HTTP_READ_TIMEOUT) -> bool:
+    key = (target, expect, connect_timeout, mode, read_timeout)
+    with _REACH_LOCK:
+        hit = _REACH_CACHE.get(key)
+    if hit and time.monotonic() - hit[0] < REACH_CACHE_TTL:
+        return hit[1]
+    ok = _probe_target(target, expect, connect_timeout, mode, read_timeout)
+    with _REACH_LOCK:
+        _REACH_CACHE[key] = (time.monotonic(), ok)
+    return ok
+
+
+def _probe_target(target: str, expect: str, connect_timeout: float, mode: str = "tcp",
+                  read_timeout: float = HTTP_READ_TIMEOUT) -> bool:
+    parsed = _parse_target(target) if target else None
+    if parsed is None:
+        # Unknown scheme and not host:port
         return False
-    if _is_http_target(target):
-        return _can_reach_http(target)
-    if _is_tcp_target(target):
-        return _can_reach_tcp(target)
-    # Unknown scheme: try TCP assuming host:port; else fail
-    return False
+    kind, addr = parsed
+    if kind == "http":
+        # A bare connect first: it is far cheaper than a request (no TLS handshake), and
+        # the HTTP check only runs once something is listening and the profile asks for it
+        if addr is not None and not _can_connect(addr[0], addr[1], connect_timeout):
+            return False
+        if mode != "http" and addr is not None:
+            return True
+        return _can_reach_http(target, timeout=read_timeout, expect=expect, connect_timeout=connect_timeout)
+    return _can_connect(addr[0], addr[1], connect_timeout)
 
 
-def wait_for_connectivity(target: str, total_timeout: int, interval: int) -> bool:
+def wait_for_connectivity(target: str, total_timeout: int, interval: int, expect: str = "2xx",
+                          connect_timeout: float = DEFAULT_CONNECT_TIMEOUT, mode: str = "tcp",
+                          cancel_event=None) -> bool:
     if not target or total_timeout <= 0:
         return True  # Nothing to wait for
-    deadline = time.time() + total_timeout
-    while time.time() < deadline:
-        if can_reach(target):
+    deadline = time.monotonic() + total_timeout
+    # A response slower than the gap between probes is no better than the next probe.
+    # Only "http" mode reads a response; other modes keep the monitor's cache key.
+    read_timeout = min(HTTP_READ_TIMEOUT, max(1.0, interval)) if mode == "http" else HTTP_READ_TIMEOUT
+    # Exponential backoff from 0.25s up to `interval`, jittered so profiles sharing a target don't probe in lockstep
+    delay = 0.25
+    while time.monotonic() < deadline:
+        if can_reach(target, expect, connect_timeout, mode, read_timeout):
             return True
-        time.sleep(max(0.2, interval))
-    return can_reach(target)
+        # never sleep past the deadline; the last probe below lands right on it
+        pause = min(min(interval, delay) * random.uniform(0.8, 1.2), max(0.0, deadline - time.monotonic()))
+        if cancel_event is not None:
+            if cancel_event.wait(pause):
+                return False
+        else:
+            time.sleep(pause)
+        delay = min(interval, delay * 2)
+    return can_reach(target, expect, connect_timeout, mode, read_timeout)
+
+
+def _backoff(interval: float, changed: bool, lo: float, hi: float) -> float:
+    """Next poll interval: back to lo after a change, otherwise doubled up to hi."""
+    return lo if changed else min(hi, interval * 2)
+
+
+def _jitter(interval: float) -> float:
+    """interval +-10%, so loops started together drift apart instead of waking in step."""
+    return interval * random.uniform(0.9, 1.1)
+
+
+def _redis_targets(group_modes: dict) -> tuple:
+    """(group, key, field) for each redis-mode group with a key; "key:field" reads a hash field, field None a string."""
+    targets = []
+    for group, gm in group_modes.items():
+        redis_key = (gm.get("redisKey", "") or "").strip()
+        if gm.get("mode") != "redis" or not redis_key:
+            continue
+        key, _, field = redis_key.partition(":")
+        targets.append((group, key, field if ":" in redis_key else None))
+    return tuple(targets)
 
 # ---------------- Profile Editor -----------------
 
@@ -213,6 +558,9 @@ class ProfileEditor(tk.Toplevel):
         self.var_wait = tk.StringVar(value=self.profile.get("waitTarget", ""))
         self.var_wait_timeout = tk.StringVar(value=str(self.profile.get("waitTimeout", 0)))
         self.var_wait_interval = tk.StringVar(value=str(self.profile.get("waitInterval", 2)))
+        self.var_wait_connect = tk.StringVar(value=str(self.profile.get("waitConnectTimeout", DEFAULT_CONNECT_TIMEOUT)))
+        self.var_wait_expect = tk.StringVar(value=self.profile.get("waitExpectStatus", "2xx"))
+        self.var_wait_mode = tk.StringVar(value=self.profile.get("waitMode", "tcp"))
         self.var_post_delay = tk.StringVar(value=str(self.profile.get("postLaunchDelay", 0)))
         self.var_auto = tk.IntVar(value=1 if bool(self.profile.get("autoStart", False)) else 0)
         self.var_restart = tk.IntVar(value=1 if bool(self.profile.get("autoRestart", False)) else 0)
@@ -244,7 +592,14 @@ class ProfileEditor(tk.Toplevel):
         ttk.Label(sub, text="Timeout (s):").pack(side="left")
         ttk.Entry(sub, textvariable=self.var_wait_timeout, width=8).pack(side="left", padx=(0, 8))
         ttk.Label(sub, text="Interval (s):").pack(side="left")
-        ttk.Entry(sub, textvariable=self.var_wait_interval, width=8).pack(side="left")
+        ttk.Entry(sub, textvariable=self.var_wait_interval, width=8).pack(side="left", padx=(0, 8))
+        ttk.Label(sub, text="Connect (s):").pack(side="left")
+        ttk.Entry(sub, textvariable=self.var_wait_connect, width=6).pack(side="left", padx=(0, 8))
+        ttk.Label(sub, text="HTTP OK:").pack(side="left")
+        ttk.Entry(sub, textvariable=self.var_wait_expect, width=10).pack(side="left", padx=(0, 8))
+        ttk.Label(sub, text="Mode:").pack(side="left")
+        ttk.Combobox(sub, textvariable=self.var_wait_mode, values=WAIT_MODES, width=6,
+                     state="readonly").pack(side="left")
         row += 1
         ttk.Label(frm, text="Post-Launch Delay (s, group only):").grid(row=row, column=0, sticky="e", padx=4, pady=4)
         ttk.Entry(frm, textvariable=self.var_post_delay, width=10).grid(row=row, column=1, sticky="w")
@@ -299,11 +654,15 @@ class ProfileEditor(tk.Toplevel):
             wt_interval = int((self.var_wait_interval.get() or "2").strip())
         except Exception:
             wt_interval = 2
+        try:
+            wt_connect = float((self.var_wait_connect.get() or str(DEFAULT_CONNECT_TIMEOUT)).strip())
+        except Exception:
+            wt_connect = DEFAULT_CONNECT_TIMEOUT
         try:
             post_delay = int((self.var_post_delay.get() or "0").strip())
         except Exception:
             post_delay = 0
-        self.result = {
+        self.result = _coerce_profile_ints({
             "name": name,
             "group": self.var_group.get().strip(),
             "order": order,
@@ -312,14 +671,30 @@ class ProfileEditor(tk.Toplevel):
             "waitTarget": wait_target,
             "waitTimeout": wt_timeout,
             "waitInterval": wt_interval,
+            "waitConnectTimeout": wt_connect,
+            "waitExpectStatus": self.var_wait_expect.get().strip() or "2xx",
+            "waitMode": _as_wait_mode(self.var_wait_mode.get(), "tcp"),
             "postLaunchDelay": post_delay,
             "autoStart": bool(int(self.var_auto.get() or 0)),
             "autoRestart": bool(int(self.var_restart.get() or 0)),
-        }
+        })
         self.destroy()
 
 # ---------------- Main Application -----------------
 
+# Menu entries as (label, SimpleLauncherApp method name); None is a separator
+_POPUP_SPEC = (
+    ("Add Profile", "on_add"),
+    ("Edit Selected", "on_edit"),
+    ("Delete Selected", "on_delete"),
+    None,
+    ("Save to launch.conf", "on_save"),
+)
+_MENU_SPEC = _POPUP_SPEC + (
+    None,
+    ("Group Launcher...", "open_group_launcher"),
+)
+
 class SimpleLauncherApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -327,26 +702,50 @@ class SimpleLauncherApp(tk.Tk):
         self.geometry("820x440")
         self.resizable(True, True)
 
-        self.data = load_profiles()
-        # defaults for new group auto-start override settings
-        self.data.setdefault("autoStartGroups", [])
-        self.data.setdefault("autoStartGroupsOverride", False)
-        # Redis settings
-        self.data.setdefault("redisHost", "localhost")
-        self.data.setdefault("redisPort", 6379)
-        self.data.setdefault("redisDb", 0)
-        self.data.setdefault("redisPassword", "")
-        # Group modes: {group_name: {"mode": "on"|"off"|"redis", "redisKey": "key:field"}}
-        self.data.setdefault("groupModes", {})
+        self.data = _normalize_settings(load_profiles())
         self.processes = {}           # name -> subprocess.Popen
         self.status_map = {}          # name -> Running / Stopped / Starting
         self.conn_status = {}         # name -> Online / Offline / - / Waiting...
         self._stop_event = threading.Event()
+        # Connectivity probes fan out per sweep; per-host slots keep one endpoint from being hammered
+        self._conn_pool = ThreadPoolExecutor(max_workers=CONN_PROBE_WORKERS, thread_name_prefix="conn-probe")
+        self._host_slots = defaultdict(lambda: threading.Semaphore(CONN_PROBES_PER_HOST))
+        # Start sequences run on a small pool; launch runners get a daemon thread each (see _start_profile)
+        self._sequence_pool = ThreadPoolExecutor(max_workers=SEQUENCE_WORKERS, thread_name_prefix="start-seq")
         self._user_stop_flags = {}    # name -> True if user manually stopped
         self._launching = set()       # names currently launching
-        self._last_restart = {}       # name -> last restart time
+        self._launch_lock = threading.Lock()  # guards the check-and-claim of _launching
+        self._launch_done = {}        # name -> Event set when the latest launch runner finishes
+        # Names whose launched process has not exited; added at launch, dropped by its _watch_process
+        # (both under _launch_lock), so group checks need no poll() per profile
+        self._running_names = set()
+        self._rows_loaded = 0         # profiles[:_rows_loaded] have rows in the tree
+        self._tree_rows = set()       # iids of the rows in the tree, mirrored at every insert/delete
+        self._profile_index = {}      # name -> index in self.data["profiles"]
+        self._groups_cache = None     # sorted non-empty group names; None = rebuild on next use
+        # Immutable snapshot of the profiles in launch order (group, order, name), swapped in whole on
+        # every change; worker threads iterate it directly without copying
+        self._profiles_sorted = ()
+        self._profiles_by_group = {}  # group -> its profiles in launch order; rebuilt with _profiles_sorted
+        self._names_by_group = {}     # group -> frozenset of its profile names; rebuilt with _profiles_sorted
+        self._any_wait_target = False # False: connectivity sweeps have nothing to probe
+        self._status_after_id = None  # pending _flush_tree_status callback, if any
+        self._status_flush_lock = threading.Lock()
+        self._tree_queued = False     # a "tree" refresh request is waiting in _ui_q
+        self._applied_status = {}     # name -> status value last written to the tree
+        self._applied_conn = {}       # name -> conn value last written to the tree
+        # Worker threads never call Tk directly; they queue requests that _pump applies
+        self._ui_q = queue.Queue()
+        self._last_restart = {}       # name -> time.monotonic() of the last restart
         self._redis_client = None
-        self._redis_monitor_running = False
+        self._redis_settings = None   # (host, port, db, password) _redis_client was built with
+        # Set to stop the current redis monitor; every monitor gets a fresh one, so a quick
+        # restart can never leave the old monitor running alongside the new one
+        self._redis_stop = threading.Event()
+        self._redis_targets = ()      # (group, key, field or None) per redis-mode group; set on monitor restart
+        self._redis_last_values = {}  # group -> desired running state its key read on the last pass
+        # Monitor restarts run one at a time on a single reused worker
+        self._redis_restart_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="redis-restart")
         self._auto_start_attempted = False  # track if auto-start has been attempted
         self._auto_start_retry_count = 0    # retry counter for failed auto-starts
 
@@ -359,11 +758,10 @@ class SimpleLauncherApp(tk.Tk):
         initial_delay = 3000 if self._is_likely_service_mode() else 200
         self.after(initial_delay, self._auto_start_profiles)
         # Background connectivity monitor
-        threading.Thread(target=self._conn_monitor, daemon=True).start()
-        # Background process monitor (autoRestart)
-        threading.Thread(target=self._proc_monitor, daemon=True).start()
+        threading.Thread(target=self._monitor, daemon=True).start()
         # Start Redis monitor if configured
         self.after(500, self._start_redis_monitor)
+        self.after(UI_PUMP_MS, self._pump)
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -371,15 +769,17 @@ class SimpleLauncherApp(tk.Tk):
     def _build_menu(self):
         m = tk.Menu(self)
         self.config(menu=m)
-        fm = tk.Menu(m, tearoff=0)
-        fm.add_command(label="Add Profile", command=self.on_add)
-        fm.add_command(label="Edit Selected", command=self.on_edit)
-        fm.add_command(label="Delete Selected", command=self.on_delete)
-        fm.add_separator()
-        fm.add_command(label="Save to launch.conf", command=self.on_save)
-        fm.add_separator()
-        fm.add_command(label="Group Launcher...", command=self.open_group_launcher)
-        m.add_cascade(label="Config", menu=fm)
+        m.add_cascade(label="Config", menu=self._make_menu(m, _MENU_SPEC))
+
+    def _make_menu(self, parent, spec):
+        menu = tk.Menu(parent, tearoff=0)
+        for entry in spec:
+            if entry is None:
+                menu.add_separator()
+            else:
+                label, attr = entry
+                menu.add_command(label=label, command=getattr(self, attr))
+        return menu
 
     def _build_main(self):
         top = ttk.Frame(self)
@@ -405,7 +805,14 @@ class SimpleLauncherApp(tk.Tk):
 
         self.tree.pack(side="left", fill="both", expand=True)
         sb = ttk.Scrollbar(top, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=sb.set)
+
+        def on_yscroll(first, last):
+            sb.set(first, last)
+            # bottom of the rendered rows is visible: append the next page
+            if float(last) >= 1.0 and self._rows_loaded < len(self.data.get("profiles", [])):
+                self.after_idle(self._load_more_rows)
+
+        self.tree.configure(yscrollcommand=on_yscroll)
         sb.pack(side="right", fill="y")
 
         # Top buttons
@@ -417,12 +824,7 @@ class SimpleLauncherApp(tk.Tk):
         ttk.Button(cfgops, text="Save to launch.conf", command=self.on_save).pack(side="left", padx=12)
 
         # Popup menu
-        self._popup = tk.Menu(self, tearoff=0)
-        self._popup.add_command(label="Add Profile", command=self.on_add)
-        self._popup.add_command(label="Edit Selected", command=self.on_edit)
-        self._popup.add_command(label="Delete Selected", command=self.on_delete)
-        self._popup.add_separator()
-        self._popup.add_command(label="Save to launch.conf", command=self.on_save)
+        self._popup = self._make_menu(self, _POPUP_SPEC)
 
         def on_right_click(event):
             try:
@@ -458,37 +860,78 @@ class SimpleLauncherApp(tk.Tk):
 
     # ---- Table loading ----
     def _load_table(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        """Full rebuild: resets row state and renders the first page; the rest load on scroll."""
+        # one Tcl call for the whole clear instead of one per row
+        rows = self.tree.get_children()
+        if rows:
+            self.tree.delete(*rows)
+        self._tree_rows.clear()
+        self._rebuild_profile_index()
+        self._resort_profiles()
+        self._groups_cache = None
         for prof in self.data.get("profiles", []):
-            name = prof.get("name")
-            if prof.get("waitTarget"):
-                self.conn_status[name] = self.conn_status.get(name, "-")
-            else:
-                self.conn_status[name] = "-"
-            self.status_map[name] = self.status_map.get(name, "Stopped")
-            self.tree.insert("", "end", iid=name, values=(
-                prof.get("name", ""),
-                prof.get("group", ""),
-                prof.get("order", 0),
-                prof.get("path", ""),
-                "Yes" if prof.get("autoStart") else "No",
-                self.conn_status.get(name, "-"),
-                self.status_map.get(name, "Stopped"),
-            ))
-        self.after(100, self._apply_status_to_tree)
+            self._init_row_state(prof)
+        self._rows_loaded = 0
+        self._load_more_rows()
         # refresh available groups in UI
         try:
             self._refresh_groups()
         except Exception:
             pass
 
+    def _rebuild_profile_index(self):
+        # name -> position in self.data["profiles"]; kept in sync by the CRUD handlers
+        self._profile_index = {p.get("name"): i for i, p in enumerate(self.data.get("profiles", []))}
+
+    def _profile_by_name(self, name):
+        idx = self._profile_index.get(name)
+        return self.data["profiles"][idx] if idx is not None else None
+
+    def _load_more_rows(self):
+        profiles = self.data.get("profiles", [])
+        end = min(len(profiles), self._rows_loaded + TABLE_PAGE_SIZE)
+        for prof in profiles[self._rows_loaded:end]:
+            self.tree.insert("", "end", iid=prof.get("name"), values=self._row_values(prof))
+            self._tree_rows.add(prof.get("name"))
+        self._rows_loaded = max(self._rows_loaded, end)
+
+    def _init_row_state(self, prof):
+        name = prof.get("name")
+        if prof.get("waitTarget"):
+            self.conn_status[name] = self.conn_status.get(name, "-")
+        else:
+            self.conn_status[name] = "-"
+        self.status_map[name] = self.status_map.get(name, "Stopped")
+
+    def _row_values(self, prof):
+        """Values for prof's row; they are about to be rendered, so also record them as applied."""
+        name = prof.get("name")
+        conn = self._applied_conn[name] = self.conn_status.get(name, "-")
+        status = self._applied_status[name] = self.status_map.get(name, "Stopped")
+        return (
+            prof.get("name", ""),
+            prof.get("group", ""),
+            prof.get("order", 0),
+            prof.get("path", ""),
+            "Yes" if prof.get("autoStart") else "No",
+            conn,
+            status,
+        )
+
+    def _resort_profiles(self):
+        self._profiles_sorted = tuple(sorted(self.data.get("profiles", []), key=_profile_sort_key))
+        by_group = defaultdict(list)
+        for p in self._profiles_sorted:
+            by_group[p["group"]].append(p)
+        self._profiles_by_group = {g: tuple(ps) for g, ps in by_group.items()}
+        self._names_by_group = {g: frozenset(p["name"] for p in ps) for g, ps in by_group.items()}
+        self._any_wait_target = any(p["waitTarget"] for p in self._profiles_sorted)
+
     def _get_groups(self):
-        try:
-            groups = sorted({(p.get("group", "") or "").strip() for p in self.data.get("profiles", [])})
-            return [g for g in groups if g]
-        except Exception:
-            return []
+        if self._groups_cache is None:
+            # group names are stripped on load/edit and already keyed in _profiles_by_group
+            self._groups_cache = tuple(sorted(g for g in self._profiles_by_group if g))
+        return list(self._groups_cache)
 
     def _refresh_groups(self):
         groups = self._get_groups()
@@ -505,12 +948,21 @@ class SimpleLauncherApp(tk.Tk):
         dlg = ProfileEditor(self)
         self.wait_window(dlg)
         if dlg.result:
-            names = {p.get("name") for p in self.data.get("profiles", [])}
-            if dlg.result["name"] in names:
+            if dlg.result["name"] in self._profile_index:
                 messagebox.showerror("Error", "Name already exists.")
                 return
-            self.data.setdefault("profiles", []).append(dlg.result)
-            self._load_table()
+            # new list rather than append: profile lists are swapped whole, never mutated in place
+            profiles = self.data["profiles"] = self.data.get("profiles", []) + [dlg.result]
+            self._profile_index[dlg.result["name"]] = len(profiles) - 1
+            self._resort_profiles()
+            self._groups_cache = None
+            self._init_row_state(dlg.result)
+            # only render it now if every row before it is already rendered
+            if self._rows_loaded == len(profiles) - 1:
+                self.tree.insert("", "end", iid=dlg.result["name"], values=self._row_values(dlg.result))
+                self._tree_rows.add(dlg.result["name"])
+                self._rows_loaded += 1
+            self._refresh_groups()
 
     def on_edit(self):
         sel = self.tree.selection()
@@ -518,29 +970,57 @@ class SimpleLauncherApp(tk.Tk):
             messagebox.showinfo("Info", "Please select a profile first.")
             return
         name = sel[0]
-        prof = next((p for p in self.data.get("profiles", []) if p.get("name") == name), None)
+        prof = self._profile_by_name(name)
         if not prof:
             messagebox.showerror("Error", "Profile not found.")
             return
         dlg = ProfileEditor(self, profile=prof)
         self.wait_window(dlg)
         if dlg.result:
-            for i, p in enumerate(self.data.get("profiles", [])):
-                if p.get("name") == name:
-                    self.data["profiles"][i] = dlg.result
-                    break
-            self._load_table()
+            new_name = dlg.result["name"]
+            idx = self._profile_index.pop(name)
+            profiles = list(self.data["profiles"])
+            profiles[idx] = dlg.result
+            self.data["profiles"] = profiles
+            self._profile_index[new_name] = idx
+            self._resort_profiles()
+            if prof["group"] != dlg.result["group"]:
+                self._groups_cache = None
+            self._init_row_state(dlg.result)
+            if new_name == name:
+                self.tree.item(name, values=self._row_values(dlg.result))
+            else:
+                # the iid is the name, so a rename swaps the row in place
+                index = self.tree.index(name)
+                self.tree.delete(name)
+                self.tree.insert("", index, iid=new_name, values=self._row_values(dlg.result))
+                self._tree_rows.discard(name)
+                self._tree_rows.add(new_name)
+            self._refresh_groups()
 
     def on_delete(self):
         sel = self.tree.selection()
         if not sel:
             return
         name = sel[0]
-        self.data["profiles"] = [p for p in self.data.get("profiles", []) if p.get("name") != name]
+        idx = self._profile_index.get(name)
+        if idx is not None:
+            # new list rather than del: monitor threads may be iterating a snapshot of the old one
+            profiles = self.data["profiles"]
+            self.data["profiles"] = profiles[:idx] + profiles[idx + 1:]
+            self._rebuild_profile_index()
+            self._resort_profiles()
+            self._groups_cache = None
         self.processes.pop(name, None)
         self.status_map.pop(name, None)
         self.conn_status.pop(name, None)
-        self._load_table()
+        self._applied_status.pop(name, None)
+        self._applied_conn.pop(name, None)
+        if name in self._tree_rows:
+            self.tree.delete(name)
+            self._tree_rows.discard(name)
+            self._rows_loaded -= 1
+        self._refresh_groups()
 
     def on_save(self):
         try:
@@ -552,67 +1032,93 @@ class SimpleLauncherApp(tk.Tk):
     # ---- Launch/Stop logic ----
     def _start_profile(self, prof: dict):
         name = prof.get("name")
-        path = (prof.get("path") or "").strip()
-        args = (prof.get("args") or "").strip()
-        wait_target = (prof.get("waitTarget") or "").strip()
-        wait_timeout = int(prof.get("waitTimeout", 0) or 0)
-        wait_interval = int(prof.get("waitInterval", 2) or 2)
+        path = prof["path"]
+        args = prof["args"]
+        wait_target = prof["waitTarget"]
+        wait_timeout = prof["waitTimeout"]
+        wait_interval = prof["waitInterval"]
+        wait_expect = prof["waitExpectStatus"]
+        wait_connect = prof["waitConnectTimeout"]
+        wait_mode = prof["waitMode"]
 
         if not path:
-            self.status.set(f"No executable path: {name}")
-            return
-        existing = self.processes.get(name)
-        if existing and getattr(existing, 'poll', lambda: None)() is None:
-            # already running
-            return
-        if name in self._launching:
+            self._set_status(f"No executable path: {name}")
             return
-
-        # mark launching before thread so sequential wait logic sees it immediately
-        self._launching.add(name)
+        # Claim the launch atomically: Start buttons, sequences and restarts can race here.
+        # Marked before the runner is queued so sequential wait logic sees it immediately.
+        with self._launch_lock:
+            if self._stop_event.is_set():
+                # closing: a start sequence still running must not launch anything new
+                return
+            existing = self.processes.get(name)
+            if existing and existing.poll() is None:
+                # already running
+                return
+            if name in self._launching:
+                return
+            self._launching.add(name)
+            done = self._launch_done[name] = threading.Event()
 
         def runner():
+            try:
+                launch()
+            finally:
+                # the only place a launch is released; waiters wake immediately
+                with self._launch_lock:
+                    self._launching.discard(name)
+                self._apply_status_to_tree()
+                done.set()
+
+        def launch():
             self.status_map[name] = "Starting"
             self._user_stop_flags[name] = False
             self._apply_status_to_tree()
             # optional connectivity wait
             if wait_target:
+                # start from a fresh probe rather than a just-cached Offline
+                forget_reach(wait_target)
                 self.conn_status[name] = "Waiting..."
                 self._apply_status_to_tree()
-                ok_conn = wait_for_connectivity(wait_target, total_timeout=wait_timeout, interval=wait_interval)
+                ok_conn = wait_for_connectivity(
+                    wait_target, total_timeout=wait_timeout, interval=wait_interval, expect=wait_expect,
+                    connect_timeout=wait_connect, mode=wait_mode, cancel_event=self._stop_event,
+                )
                 self.conn_status[name] = "Online" if ok_conn else "Offline"
                 self._apply_status_to_tree()
                 if wait_target and not ok_conn:
-                    self.status.set(f"Connectivity failed/timeout: {wait_target}")
+                    self._set_status(f"Connectivity failed/timeout: {wait_target}")
                     self.status_map[name] = "Stopped"
-                    self._launching.discard(name)
-                    self._apply_status_to_tree()
                     return
             # launch process
             try:
-                cmd = [path] + ([a for a in args.split() if a] if args else [])
+                cmd = [path, *_split_args(args)]
                 
                 # Robust launch arguments for service/headless environments
                 kwargs = {
-                    "cwd": str(Path(path).parent),
+                    "cwd": _app_cwd(path),
                     "stdin": subprocess.DEVNULL,
+                    # never leak the launcher's sockets/pipes into the app
+                    "close_fds": True,
                 }
                 if sys.platform != "win32":
                     kwargs["start_new_session"] = True
                 
                 proc = subprocess.Popen(cmd, **kwargs)
-                self.processes[name] = proc
+                with self._launch_lock:
+                    self.processes[name] = proc
+                    self._running_names.add(name)
+                # exit detection (autoRestart / user-closed) wakes on the process itself, no polling
+                threading.Thread(target=self._watch_process, args=(name, proc), daemon=True).start()
                 self.status_map[name] = "Running"
-                self.status.set(f"Started: {name}")
+                self._set_status(f"Started: {name}")
             except Exception as e:
                 self.status_map[name] = "Stopped"
-                self.status.set(f"Launch failed {name}: {e}")
+                self._set_status(f"Launch failed {name}: {e}")
                 log_crash(name, path, f"launch_failed: {e}")
-            finally:
-                self._launching.discard(name)
-                self._apply_status_to_tree()
 
-        threading.Thread(target=runner, daemon=True).start()
+        # One daemon thread per runner: a runner can sit in its connectivity wait for the whole waitTimeout,
+        # so a bounded pool would leave later launches queued while their names are already claimed
+        threading.Thread(target=runner, daemon=True, name=f"launch-{name}").start()
 
     def _stop_profile(self, prof: dict):
         name = prof.get("name")
@@ -623,11 +1129,11 @@ class SimpleLauncherApp(tk.Tk):
             executable_path = prof.get("path", "unknown")
             log_crash(name, executable_path, "stopped_by_launcher")
             try:
-                p.terminate()
+                _signal_app(p)
                 try:
                     p.wait(timeout=3)
                 except Exception:
-                    p.kill()
+                    _signal_app(p, kill=True)
             except Exception:
                 pass
         self.processes.pop(name, None)
@@ -639,7 +1145,7 @@ class SimpleLauncherApp(tk.Tk):
         if not sel:
             return
         name = sel[0]
-        prof = next((p for p in self.data.get("profiles", []) if p.get("name") == name), None)
+        prof = self._profile_by_name(name)
         if prof:
             self._start_profile(prof)
 
@@ -648,125 +1154,104 @@ class SimpleLauncherApp(tk.Tk):
         if not sel:
             return
         name = sel[0]
-        prof = next((p for p in self.data.get("profiles", []) if p.get("name") == name), None)
+        prof = self._profile_by_name(name)
         if prof:
             self._stop_profile(prof)
 
+    def _wait_launch(self, prof: dict):
+        """Block the calling worker until prof's launch runner finishes (or its timeout passes)."""
+        ev = self._launch_done.get(prof.get("name"))
+        if ev is not None:
+            ev.wait(max(10, prof["waitTimeout"] + 10))
+
+    def _post_launch_delay(self, prof: dict, announce: bool = True):
+        # optional pause after a grouped app; returns early when the window closes
+        try:
+            delay = prof["postLaunchDelay"]
+            if prof["group"] and delay > 0:
+                if announce:
+                    self._set_status(f"Waiting {delay}s before next launch...")
+                self._stop_event.wait(delay)
+        except Exception:
+            pass
+
     def on_start_all(self):
         # Start all profiles sequentially in the defined order
         def worker():
-            profs = list(self.data.get("profiles", []))
-            profs.sort(key=lambda p: (p.get("group", ""), int(p.get("order", 0) or 0), p.get("name", "")))
+            profs = self._profiles_sorted
             for idx, prof in enumerate(profs):
                 try:
                     name = prof.get("name")
-                    self.status.set(f"Starting {idx+1}/{len(profs)}: {name}")
+                    self._set_status(f"Starting {idx+1}/{len(profs)}: {name}")
                     self._start_profile(prof)
-                    # wait for launch thread to complete (name removed from _launching)
-                    timeout = max(10, int(prof.get("waitTimeout", 0) or 0) + 10)
-                    deadline = time.time() + timeout
-                    time.sleep(0.3)  # give thread time to start
-                    while name in self._launching and not self._stop_event.is_set() and time.time() < deadline:
-                        time.sleep(0.2)
+                    # wait for the launch runner to finish (signalled, no polling)
+                    self._wait_launch(prof)
                     # optional post-launch delay if in a group
-                    try:
-                        if (prof.get("group", "").strip() and int(prof.get("postLaunchDelay", 0) or 0) > 0):
-                            delay = int(prof.get("postLaunchDelay", 0) or 0)
-                            self.status.set(f"Waiting {delay}s before next launch...")
-                            end = time.time() + delay
-                            while time.time() < end and not self._stop_event.is_set():
-                                time.sleep(0.2)
-                    except Exception:
-                        pass
+                    self._post_launch_delay(prof)
                 except Exception:
                     pass
-            self.status.set("Start all complete")
+            self._set_status("Start all complete")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._sequence_pool.submit(worker)
 
     def _start_groups(self, groups):
-        groups = [g.strip() for g in (groups or []) if g and g.strip()]
-        if not groups:
+        gset = {name for g in (groups or ()) if g and (name := g.strip())}
+        if not gset:
             return
-        gset = set(groups)
 
         def worker():
-            profs = [p for p in self.data.get("profiles", []) if (p.get("group", "").strip() in gset)]
-            profs.sort(key=lambda p: (p.get("group", ""), int(p.get("order", 0) or 0), p.get("name", "")))
+            profs = [p for g in sorted(gset) for p in self._profiles_by_group.get(g, ())]
             for idx, prof in enumerate(profs):
                 try:
                     name = prof.get("name")
-                    self.status.set(f"Starting {idx+1}/{len(profs)}: {name}")
+                    self._set_status(f"Starting {idx+1}/{len(profs)}: {name}")
                     self._start_profile(prof)
-                    timeout = max(10, int(prof.get("waitTimeout", 0) or 0) + 10)
-                    deadline = time.time() + timeout
-                    time.sleep(0.3)  # give thread time to start
-                    while name in self._launching and not self._stop_event.is_set() and time.time() < deadline:
-                        time.sleep(0.2)
-                    try:
-                        if (prof.get("group", "").strip() and int(prof.get("postLaunchDelay", 0) or 0) > 0):
-                            delay = int(prof.get("postLaunchDelay", 0) or 0)
-                            self.status.set(f"Waiting {delay}s before next launch...")
-                            end = time.time() + delay
-                            while time.time() < end and not self._stop_event.is_set():
-                                time.sleep(0.2)
-                    except Exception:
-                        pass
+                    # wait for the launch runner to finish (signalled, no polling)
+                    self._wait_launch(prof)
+                    self._post_launch_delay(prof)
                 except Exception:
                     pass
-            self.status.set(f"Start groups {sorted(gset)} complete")
+            self._set_status(f"Start groups {sorted(gset)} complete")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._sequence_pool.submit(worker)
 
     def on_start_group(self):
         group = (self.group_var.get() or "").strip()
         if not group:
-            self.status.set("Select a group to start")
+            self._set_status("Select a group to start")
             return
 
         def worker():
-            profs = [p for p in self.data.get("profiles", []) if (p.get("group", "").strip() == group)]
-            profs.sort(key=lambda p: (int(p.get("order", 0) or 0), p.get("name", "")))
+            profs = self._profiles_by_group.get(group, ())
             for idx, prof in enumerate(profs):
                 try:
                     name = prof.get("name")
-                    self.status.set(f"Starting {idx+1}/{len(profs)}: {name}")
+                    self._set_status(f"Starting {idx+1}/{len(profs)}: {name}")
                     self._start_profile(prof)
-                    timeout = max(10, int(prof.get("waitTimeout", 0) or 0) + 10)
-                    deadline = time.time() + timeout
-                    time.sleep(0.3)  # give thread time to start
-                    while name in self._launching and not self._stop_event.is_set() and time.time() < deadline:
-                        time.sleep(0.2)
-                    try:
-                        if (prof.get("group", "").strip() and int(prof.get("postLaunchDelay", 0) or 0) > 0):
-                            delay = int(prof.get("postLaunchDelay", 0) or 0)
-                            self.status.set(f"Waiting {delay}s before next launch...")
-                            end = time.time() + delay
-                            while time.time() < end and not self._stop_event.is_set():
-                                time.sleep(0.2)
-                    except Exception:
-                        pass
+                    # wait for the launch runner to finish (signalled, no polling)
+                    self._wait_launch(prof)
+                    self._post_launch_delay(prof)
                 except Exception:
                     pass
-            self.status.set(f"Start group '{group}' complete")
+            self._set_status(f"Start group '{group}' complete")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._sequence_pool.submit(worker)
 
     def on_stop_group(self):
         group = (self.group_var.get() or "").strip()
         if not group:
-            self.status.set("Select a group to stop")
+            self._set_status("Select a group to stop")
             return
-        profs = [p for p in self.data.get("profiles", []) if (p.get("group", "").strip() == group)]
+        profs = self._profiles_by_group.get(group, ())
         for prof in profs:
             try:
                 self._stop_profile(prof)
             except Exception:
                 pass
-        self.status.set(f"Stop group '{group}' complete")
+        self._set_status(f"Stop group '{group}' complete")
 
     def on_stop_all(self):
-        for prof in list(self.data.get("profiles", [])):
+        for prof in self._profiles_sorted:
             try:
                 self._stop_profile(prof)
             except Exception:
@@ -779,55 +1264,38 @@ class SimpleLauncherApp(tk.Tk):
                 self._auto_start_attempted = True
                 
                 # Auto-start behavior with optional group override
-                override = bool(self.data.get("autoStartGroupsOverride"))
-                group_modes = self.data.get("groupModes", {})
+                override = self.data["autoStartGroupsOverride"]
+                group_modes = self.data["groupModes"]
                 
                 if override:
                     # Use group modes: start groups with mode='on'
                     on_groups = {g for g, gm in group_modes.items() if gm.get("mode") == "on"}
-                    profs = []
-                    # Add grouped apps with mode='on'
-                    if on_groups:
-                        profs.extend([p for p in self.data.get("profiles", []) if (p.get("group", "").strip() in on_groups)])
-                    # Always include ungrouped apps with autoStart=true
-                    profs.extend([p for p in self.data.get("profiles", []) 
-                                 if p.get("autoStart") and not (p.get("group", "").strip())])
+                    # Grouped apps with mode='on', plus ungrouped apps with autoStart=true
+                    profs = [p for p in self._profiles_sorted
+                             if p["group"] in on_groups or (p.get("autoStart") and not p["group"])]
                 else:
                     # fallback to per-app autoStart
-                    profs = [p for p in self.data.get("profiles", []) if p.get("autoStart")]
+                    profs = [p for p in self._profiles_sorted if p.get("autoStart")]
                 
                 if not profs:
-                    self.status.set("No profiles to auto-start")
+                    self._set_status("No profiles to auto-start")
                     return
                 
-                profs.sort(key=lambda p: (p.get("group", ""), int(p.get("order", 0) or 0), p.get("name", "")))
-                
                 failed_profs = []
                 for idx, prof in enumerate(profs):
                     try:
                         name = prof.get("name")
-                        self.status.set(f"Auto-starting {idx+1}/{len(profs)}: {name}")
+                        self._set_status(f"Auto-starting {idx+1}/{len(profs)}: {name}")
                         self._start_profile(prof)
-                        timeout = max(10, int(prof.get("waitTimeout", 0) or 0) + 10)
-                        deadline = time.time() + timeout
-                        time.sleep(0.3)  # give thread time to start
-                        while name in self._launching and not self._stop_event.is_set() and time.time() < deadline:
-                            time.sleep(0.2)
+                        # wait for the launch runner to finish (signalled, no polling)
+                        self._wait_launch(prof)
                         
                         # Check if launch actually succeeded
                         if name not in self.processes or self.processes[name].poll() is not None:
                             failed_profs.append(prof)
                         
                         # optional post-launch delay if in a group
-                        try:
-                            if (prof.get("group", "").strip() and int(prof.get("postLaunchDelay", 0) or 0) > 0):
-                                delay = int(prof.get("postLaunchDelay", 0) or 0)
-                                self.status.set(f"Waiting {delay}s before next launch...")
-                                end = time.time() + delay
-                                while time.time() < end and not self._stop_event.is_set():
-                                    time.sleep(0.2)
-                        except Exception:
-                            pass
+                        self._post_launch_delay(prof)
                     except Exception as e:
                         failed_profs.append(prof)
                         # Log the error
@@ -842,14 +1310,14 @@ class SimpleLauncherApp(tk.Tk):
                 if failed_profs and self._auto_start_retry_count < 3:
                     self._auto_start_retry_count += 1
                     retry_delay = 5 * self._auto_start_retry_count  # 5s, 10s, 15s
-                    self.status.set(f"Retrying {len(failed_profs)} failed launches in {retry_delay}s (attempt {self._auto_start_retry_count}/3)...")
-                    self.after(retry_delay * 1000, lambda: self._retry_failed_starts(failed_profs))
+                    self._set_status(f"Retrying {len(failed_profs)} failed launches in {retry_delay}s (attempt {self._auto_start_retry_count}/3)...")
+                    self._ui_q.put(("after", retry_delay * 1000, lambda: self._retry_failed_starts(failed_profs)))
                 elif failed_profs:
-                    self.status.set(f"Auto start complete ({len(failed_profs)} failed after retries)")
+                    self._set_status(f"Auto start complete ({len(failed_profs)} failed after retries)")
                 else:
-                    self.status.set("Auto start complete")
+                    self._set_status("Auto start complete")
             except Exception as e:
-                self.status.set(f"Auto start error: {e}")
+                self._set_status(f"Auto start error: {e}")
                 try:
                     with CRASH_LOG_PATH.open("a", encoding="utf-8") as f:
                         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
@@ -857,7 +1325,7 @@ class SimpleLauncherApp(tk.Tk):
                 except Exception:
                     pass
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._sequence_pool.submit(worker)
 
     def _retry_failed_starts(self, failed_profs):
         """Retry launching profiles that failed during auto-start"""
@@ -871,25 +1339,17 @@ class SimpleLauncherApp(tk.Tk):
                         if name in self.processes and self.processes[name].poll() is None:
                             continue
                         
-                        self.status.set(f"Retrying {idx+1}/{len(failed_profs)}: {name}")
+                        self._set_status(f"Retrying {idx+1}/{len(failed_profs)}: {name}")
                         self._start_profile(prof)
-                        timeout = max(10, int(prof.get("waitTimeout", 0) or 0) + 10)
-                        deadline = time.time() + timeout
-                        time.sleep(0.3)
-                        while name in self._launching and not self._stop_event.is_set() and time.time() < deadline:
-                            time.sleep(0.2)
+                        # wait for the launch runner to finish (signalled, no polling)
+                        self._wait_launch(prof)
                         
                         # Check if launch succeeded
                         if name not in self.processes or self.processes[name].poll() is not None:
                             still_failed.append(prof)
                         
                         # Post-launch delay
-                        try:
-                            if (prof.get("group", "").strip() and int(prof.get("postLaunchDelay", 0) or 0) > 0):
-                                delay = int(prof.get("postLaunchDelay", 0) or 0)
-                                time.sleep(delay)
-                        except Exception:
-                            pass
+                        self._post_launch_delay(prof, announce=False)
                     except Exception:
                         still_failed.append(prof)
                 
@@ -897,22 +1357,22 @@ class SimpleLauncherApp(tk.Tk):
                 if still_failed and self._auto_start_retry_count < 3:
                     self._auto_start_retry_count += 1
                     retry_delay = 5 * self._auto_start_retry_count
-                    self.status.set(f"Retrying {len(still_failed)} failed launches in {retry_delay}s (attempt {self._auto_start_retry_count}/3)...")
-                    self.after(retry_delay * 1000, lambda: self._retry_failed_starts(still_failed))
+                    self._set_status(f"Retrying {len(still_failed)} failed launches in {retry_delay}s (attempt {self._auto_start_retry_count}/3)...")
+                    self._ui_q.put(("after", retry_delay * 1000, lambda: self._retry_failed_starts(still_failed)))
                 elif still_failed:
-                    self.status.set(f"Auto start complete ({len(still_failed)} failed after retries)")
+                    self._set_status(f"Auto start complete ({len(still_failed)} failed after retries)")
                 else:
-                    self.status.set("All retried launches successful")
+                    self._set_status("All retried launches successful")
             except Exception:
                 pass
         
-        threading.Thread(target=worker, daemon=True).start()
+        self._sequence_pool.submit(worker)
 
     def open_group_launcher(self):
         try:
             GroupLauncherWindow(self)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to open Group Launcher: {e}")
+            self._set_status(f"Failed to open Group Launcher: {e}")
 
     def _is_likely_service_mode(self):
         """Detect if running as a systemd service or at boot"""
@@ -930,209 +1390,392 @@ class SimpleLauncherApp(tk.Tk):
         return False
 
     # ---- Background monitors ----
+    @staticmethod
+    def _on_tk_thread() -> bool:
+        return threading.current_thread() is threading.main_thread()
+
+    def _set_status(self, msg: str):
+        if self._on_tk_thread():
+            self.status.set(msg)
+        else:
+            self._ui_q.put(("status_text", msg))
+
+    def _pump(self):
+        # Apply queued worker requests in one batch; only the newest status text is shown
+        if self._stop_event.is_set():
+            return
+        latest = None
+        tree = False
+        for _ in range(UI_PUMP_BATCH):
+            try:
+                item = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            kind = item[0]
+            if kind == "status_text":
+                latest = item[1]
+            elif kind == "tree":
+                # cleared before the flush reads state, so later changes queue a new request
+                self._tree_queued = False
+                tree = True
+            elif kind == "after":
+                self.after(item[1], item[2])
+        if latest is not None:
+            self.status.set(latest)
+        if tree:
+            self._apply_status_to_tree()
+        self.after(UI_PUMP_MS, self._pump)
+
     def _apply_status_to_tree(self):
-        for name in list(self.status_map.keys()):
-            if name in self.tree.get_children():
-                try:
-                    self.tree.set(name, column="status", value=self.status_map.get(name, "Stopped"))
-                except Exception:
-                    pass
-        for name in list(self.conn_status.keys()):
-            if name in self.tree.get_children():
+        if not self._on_tk_thread():
+            # one outstanding request is enough: the flush reads the latest state anyway
+            if not self._tree_queued:
+                self._tree_queued = True
+                self._ui_q.put(("tree",))
+            return
+        # Callers (often several per launch) just request a refresh; one flush runs per TREE_FLUSH_MS
+        with self._status_flush_lock:
+            if self._status_after_id is not None:
+                return
+            self._status_after_id = self.after(TREE_FLUSH_MS, self._flush_tree_status)
+
+    def _flush_tree_status(self):
+        with self._status_flush_lock:
+            self._status_after_id = None
+        # Only cells whose value changed since they were last written cost a Tcl call
+        changed = [(name, "status", val) for name, val in list(self.status_map.items())
+                   if self._applied_status.get(name) != val]
+        changed += [(name, "conn", val) for name, val in list(self.conn_status.items())
+                    if self._applied_conn.get(name) != val]
+        if not changed:
+            return
+        # the mirrored row set answers membership without a Tcl round-trip
+        rows = self._tree_rows
+        for name, column, val in changed:
+            if name in rows:
                 try:
-                    self.tree.set(name, column="conn", value=self.conn_status.get(name, "-"))
+                    self.tree.set(name, column=column, value=val)
+                    (self._applied_status if column == "status" else self._applied_conn)[name] = val
                 except Exception:
                     pass
 
-    def _conn_monitor(self):
-        while not self._stop_event.is_set():
+    @staticmethod
+    def _probe_with_slot(slot, target: str, expect: str, connect_timeout: float, mode: str) -> bool:
+        with slot:
+            return can_reach(target, expect, connect_timeout, mode)
+
+    def _monitor(self):
+        """The one periodic background loop: a connectivity sweep every CONN_POLL_INTERVAL,
+        backing off to CONN_POLL_MAX while no status changes.
+        Process liveness needs no polling; each launch gets a _watch_process waiter."""
+        interval = CONN_POLL_INTERVAL
+        while True:
             try:
-                for prof in list(self.data.get("profiles", [])):
-                    name = prof.get("name")
-                    wt = (prof.get("waitTarget") or "").strip()
-                    if not wt:
-                        continue
-                    ok = False
-                    try:
-                        ok = can_reach(wt)
-                    except Exception:
-                        ok = False
-                    self.conn_status[name] = "Online" if ok else "Offline"
-                self.after(0, self._apply_status_to_tree)
+                changed = self._monitor_tick()
             except Exception:
-                pass
-            for _ in range(6):
-                if self._stop_event.is_set():
-                    break
-                time.sleep(0.5)
+                changed = True
+            interval = _backoff(interval, changed, CONN_POLL_INTERVAL, CONN_POLL_MAX)
+            # one blocking wait per sweep; returns at once when the window closes
+            if self._stop_event.wait(_jitter(interval)):
+                break
+
+    def _monitor_tick(self) -> bool:
+        """One connectivity sweep; True if any profile's conn status changed."""
+        if not self._any_wait_target:
+            return False
+        # Profiles sharing a target and probe settings share one probe per sweep
+        targets = defaultdict(list)
+        for prof in self._profiles_sorted:
+            wt = prof["waitTarget"]
+            if wt:
+                key = (wt, prof["waitExpectStatus"], prof["waitConnectTimeout"], prof["waitMode"])
+                targets[key].append(prof.get("name"))
+        futures = {}
+        changed = False
+        for key, names in targets.items():
+            wt = key[0]
+            parsed = _parse_target(wt)
+            # slots are per endpoint, so an http and a tcp target on one host:port share them
+            endpoint = (parsed[1] if parsed else None) or wt
+            fut = self._conn_pool.submit(self._probe_with_slot, self._host_slots[endpoint], *key)
+            futures[fut] = names
+        try:
+            for fut in as_completed(futures, timeout=CONN_SWEEP_TIMEOUT):
+                try:
+                    ok = fut.result()
+                except Exception:
+                    ok = False
+                value = "Online" if ok else "Offline"
+                for name in futures[fut]:
+                    if self.conn_status.get(name) != value:
+                        self.conn_status[name] = value
+                        changed = True
+        except Exception:
+            # Timed out: keep what arrived; stragglers report next sweep
+            changed = True
+        # one tree update per tick, and none for a sweep that changed nothing
+        if changed:
+            self._apply_status_to_tree()
+        return changed
 
-    def _proc_monitor(self):
-        while not self._stop_event.is_set():
-            try:
-                now = time.time()
-                for prof in list(self.data.get("profiles", [])):
-                    name = prof.get("name")
-                    if name in self._launching:
-                        continue
-                    p = self.processes.get(name)
-                    if p is None:
-                        continue
-                    running = getattr(p, 'poll', lambda: None)() is None
-                    if running:
-                        continue
-                    
-                    # Process has exited
-                    executable_path = prof.get("path", "unknown")
-                    
-                    # Determine termination type
-                    if self._user_stop_flags.get(name):
-                        # Was stopped by launcher button (already logged in _stop_profile)
-                        pass
-                    elif prof.get("autoRestart"):
-                        # Has autoRestart enabled, so this is a crash/unexpected exit
-                        log_crash(name, executable_path, "crashed")
-                        # Auto-restart logic
-                        last = self._last_restart.get(name, 0)
-                        if now - last >= 3:
-                            self._last_restart[name] = now
-                            self.status.set(f"Detected exit, restarting: {name}")
-                            self._start_profile(prof)
-                    else:
-                        # No autoRestart, user must have closed it directly (Alt+F4, X button, etc.)
-                        log_crash(name, executable_path, "user_closed")
-                        # Update status to reflect stopped state
-                        self.processes.pop(name, None)
-                        self.status_map[name] = "Stopped"
-                        self.after(0, self._apply_status_to_tree)
-            except Exception:
-                pass
-            for _ in range(6):
-                if self._stop_event.is_set():
-                    break
-                time.sleep(0.5)
+    def _watch_process(self, name: str, proc):
+        """Block until proc exits, then apply the exit policy. One waiter per launched process."""
+        try:
+            proc.wait()
+        except Exception:
+            return
+        with self._launch_lock:
+            # a newer launch may already own the name; its process is still running
+            if self.processes.get(name) in (None, proc):
+                self._running_names.discard(name)
+        if self._stop_event.is_set():
+            return
+        # let the launch runner finish its bookkeeping first (it may still be in its finally)
+        done = self._launch_done.get(name)
+        if done is not None:
+            done.wait(30)
+        if self.processes.get(name) is not proc:
+            # stopped via the launcher or already replaced by a newer launch
+            return
+        prof = self._profile_by_name(name)
+        if prof is None:
+            return
+        executable_path = prof.get("path", "unknown")
+
+        # Determine termination type
+        if self._user_stop_flags.get(name):
+            # Was stopped by launcher button (already logged in _stop_profile)
+            return
+        if prof.get("autoRestart"):
+            # Has autoRestart enabled, so this is a crash/unexpected exit
+            log_crash(name, executable_path, "crashed")
+            # Cooldown to avoid rapid restart loops
+            remaining = 3 - (time.monotonic() - self._last_restart.get(name, 0))
+            if remaining > 0 and self._stop_event.wait(remaining):
+                return
+            self._last_restart[name] = time.monotonic()
+            self._set_status(f"Detected exit, restarting: {name}")
+            self._start_profile(prof)
+        else:
+            # No autoRestart, user must have closed it directly (Alt+F4, X button, etc.)
+            log_crash(name, executable_path, "user_closed")
+            # Update status to reflect stopped state
+            self.processes.pop(name, None)
+            self.status_map[name] = "Stopped"
+            self._apply_status_to_tree()
 
     def _start_redis_monitor(self):
         """Start or restart Redis monitoring thread"""
         if not REDIS_AVAILABLE:
             return
+        # The restart pings the server (up to the 2s connect timeout);
+        # keep that off the Tk thread so Apply and startup stay responsive
+        try:
+            self._redis_restart_pool.submit(self._restart_redis_monitor)
+        except RuntimeError:
+            # pool already shut down: the window is closing
+            pass
+
+    def _restart_redis_monitor(self):
+        # Stop existing monitor; it exits on its own once it sees its event
+        self._redis_stop.set()
         
-        # Stop existing monitor
-        self._redis_monitor_running = False
-        time.sleep(0.3)  # let old thread exit
-        
-        # Check if any groups use redis mode
-        group_modes = self.data.get("groupModes", {})
-        has_redis = any(gm.get("mode") == "redis" for gm in group_modes.values())
-        if not has_redis:
+        # Parse the redis-mode groups' keys once; group modes only change through here (Apply)
+        self._redis_targets = _redis_targets(self.data["groupModes"])
+        if not self._redis_targets:
             return
         
-        # Create new Redis client
+        # Reuse the client (and its pooled connection) unless the server settings changed
         try:
-            host = self.data.get("redisHost", "localhost")
-            port = int(self.data.get("redisPort", 6379))
-            db = int(self.data.get("redisDb", 0))
-            password = self.data.get("redisPassword", "").strip() or None
-            
-            self._redis_client = redis.Redis(
-                host=host,
-                port=port,
-                db=db,
-                password=password,
-                decode_responses=True,
-                socket_connect_timeout=2,
-                socket_timeout=2
-            )
+            host = self.data["redisHost"]
+            port = self.data["redisPort"]
+            db = self.data["redisDb"]
+            password = self.data["redisPassword"] or None
+            settings = (host, port, db, password)
+        
+            if self._redis_client is None or settings != self._redis_settings:
+                self._close_redis_client()
+                self._redis_client = redis.Redis(
+                    host=host,
+                    port=port,
+                    db=db,
+                    password=password,
+                    decode_responses=True,
+                    socket_connect_timeout=2,
+                    socket_timeout=2,
+                    socket_keepalive=True,
+                )
+                self._redis_settings = settings
             # Test connection
             self._redis_client.ping()
-            self._redis_monitor_running = True
-            threading.Thread(target=self._redis_monitor, daemon=True).start()
+            self._redis_stop = threading.Event()
+            threading.Thread(target=self._redis_monitor, args=(self._redis_stop,), daemon=True).start()
         except Exception as e:
-            self.status.set(f"Redis connection failed: {e}")
-            self._redis_client = None
+            self._set_status(f"Redis connection failed: {e}")
+            self._close_redis_client()
 
-    def _redis_monitor(self):
-        """Monitor Redis keys and control group start/stop"""
-        while self._redis_monitor_running and not self._stop_event.is_set():
+    def _close_redis_client(self):
+        client, self._redis_client = self._redis_client, None
+        if client is not None:
             try:
+                client.connection_pool.disconnect()
+            except Exception:
+                pass
+
+    def _redis_watched_keys(self):
+        """Redis keys the redis-mode groups read ("key" or the hash of "key:field")."""
+        return {key for _, key, _ in self._redis_targets}
+
+    def _redis_subscribe(self):
+        """Subscribe to keyspace events for the watched keys, or None if the server does not publish them.
+        The server's notify-keyspace-events setting is only read, never changed."""
+        try:
+            flags = self._redis_client.config_get("notify-keyspace-events").get("notify-keyspace-events", "")
+            # K = keyspace channel; A, or $ (strings) + h (hashes) + g (del/expire), = the events we need
+            if "K" not in flags or not ("A" in flags or all(c in flags for c in "$hg")):
+                return None
+            keys = self._redis_watched_keys()
+            if not keys:
+                return None
+            pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(*(f"__keyspace@{self.data['redisDb']}__:{k}" for k in keys))
+            return pubsub
+        except Exception:
+            return None
+
+    def _redis_monitor(self, stop: threading.Event):
+        """Monitor Redis keys and control group start/stop.
+        With keyspace notifications a key change is applied as soon as it is published and the
+        groups are otherwise reconciled every REDIS_RECONCILE_INTERVAL; without them, keys are polled."""
+        pubsub = self._redis_subscribe()
+        changed = None  # keys named by the last notifications; None = re-check every group
+        interval = REDIS_POLL_INTERVAL
+        try:
+            while not stop.is_set() and not self._stop_event.is_set():
                 if not self._redis_client:
                     break
+                flipped = self._redis_apply_groups(changed)
+                changed = None
+                if pubsub is None:
+                    # Poll, backing off while no key changes; a restart or close wakes the wait at once
+                    interval = _backoff(interval, flipped, REDIS_POLL_INTERVAL, REDIS_POLL_MAX)
+                    stop.wait(_jitter(interval))
+                    continue
+                # Block on the subscription in 1s slices so a restart or close is noticed promptly
+                deadline = time.monotonic() + REDIS_RECONCILE_INTERVAL
+                while time.monotonic() < deadline and not stop.is_set():
+                    try:
+                        msg = pubsub.get_message(timeout=1.0)
+                        if msg is not None:
+                            # drain the burst (SET + EXPIRE, HSET of several fields) into one pass
+                            # that only re-checks the groups whose keys changed
+                            changed = set()
+                            while msg is not None:
+                                changed.add(str(msg.get("channel", "")).split(":", 1)[-1])
+                                msg = pubsub.get_message(timeout=0.05)
+                            break
+                    except Exception:
+                        # subscription lost: fall back to polling until the monitor is restarted
+                        pubsub = None
+                        break
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+    def _redis_apply_groups(self, keys=None) -> bool:
+        """Bring redis-mode groups in line with their keys; only groups reading one of keys if given.
+        Returns True if any key read differently than on the previous pass."""
+        changed = False
+        try:
+            groups = []
+            # All lookups go out in one pipeline: one round-trip however many groups there are
+            pipe = self._redis_client.pipeline(transaction=False)
+            for group, key, field in self._redis_targets:
+                if keys is not None and key not in keys:
+                    continue
+                if field is not None:
+                    pipe.hget(key, field)
+                else:
+                    pipe.get(key)
+                groups.append(group)
+            if not groups:
+                return False
+            # a failed command (e.g. wrong key type) comes back as its exception and reads as unset;
+            # a lost connection raises here and leaves every group as it is
+            values = pipe.execute(raise_on_error=False)
+            
+            for group, value in zip(groups, values):
+                # Determine desired state: 1=running, 0/missing=stopped
+                should_run = (value == "1")
+                if self._redis_last_values.get(group) != should_run:
+                    self._redis_last_values[group] = should_run
+                    changed = True
                 
-                group_modes = self.data.get("groupModes", {})
-                for group, gm in group_modes.items():
-                    if gm.get("mode") != "redis":
-                        continue
-                    
-                    redis_key = (gm.get("redisKey", "") or "").strip()
-                    if not redis_key:
-                        continue
-                    
-                    # Parse key:field format
-                    if ":" in redis_key:
-                        key, field = redis_key.split(":", 1)
-                        try:
-                            value = self._redis_client.hget(key, field)
-                        except Exception:
-                            value = None
-                    else:
+                # Get current state of group
+                profs = self._profiles_by_group.get(group, ())
+                is_running = not self._running_names.isdisjoint(self._names_by_group.get(group, ()))
+                
+                # Apply state change
+                if should_run and not is_running:
+                    # Start group
+                    self._set_status(f"Redis trigger: starting group '{group}'")
+                    self._start_groups([group])
+                elif not should_run and is_running:
+                    # Stop group
+                    self._set_status(f"Redis trigger: stopping group '{group}'")
+                    for prof in profs:
                         try:
-                            value = self._redis_client.get(redis_key)
+                            self._stop_profile(prof)
                         except Exception:
-                            value = None
-                    
-                    # Determine desired state: 1=running, 0/missing=stopped
-                    should_run = (value == "1")
-                    
-                    # Get current state of group
-                    profs = [p for p in self.data.get("profiles", []) if p.get("group", "").strip() == group]
-                    running_count = sum(1 for p in profs if p.get("name") in self.processes 
-                                       and self.processes[p.get("name")].poll() is None)
-                    is_running = running_count > 0
-                    
-                    # Apply state change
-                    if should_run and not is_running:
-                        # Start group
-                        self.status.set(f"Redis trigger: starting group '{group}'")
-                        self._start_groups([group])
-                    elif not should_run and is_running:
-                        # Stop group
-                        self.status.set(f"Redis trigger: stopping group '{group}'")
-                        for prof in profs:
-                            try:
-                                self._stop_profile(prof)
-                            except Exception:
-                                pass
-                
-            except Exception as e:
-                # Connection lost or other error
-                pass
+                            pass
             
-            # Poll interval
-            for _ in range(10):  # 2 seconds total
-                if self._stop_event.is_set() or not self._redis_monitor_running:
-                    break
-                time.sleep(0.2)
+        except Exception as e:
+            # Connection lost or other error
+            pass
+        return changed
 
     def _on_close(self):
         try:
             self._stop_event.set()
+            self._redis_stop.set()
+            self._conn_pool.shutdown(wait=False, cancel_futures=True)
+            self._sequence_pool.shutdown(wait=False, cancel_futures=True)
+            self._redis_restart_pool.shutdown(wait=False, cancel_futures=True)
+            if _HTTP_POOL is not None:
+                # drop the kept-alive probe connections
+                _HTTP_POOL.clear()
+            # release sequential start workers blocked on a launch
+            for ev in list(self._launch_done.values()):
+                ev.set()
         except Exception:
             pass
         try:
+            # Signal every app first, then share one grace period: closing takes ~2s, not 2s per app
+            running = []
             for name, p in list(self.processes.items()):
-                if p and getattr(p, 'poll', lambda: None)() is None:
+                if p and p.poll() is None:
                     # Find profile to get executable path
-                    prof = next((pr for pr in self.data.get("profiles", []) if pr.get("name") == name), None)
+                    prof = self._profile_by_name(name)
                     if prof:
                         executable_path = prof.get("path", "unknown")
                         log_crash(name, executable_path, "launcher_closed")
                     
                     self._user_stop_flags[name] = True
                     try:
-                        p.terminate()
-                        try:
-                            p.wait(timeout=2)
-                        except Exception:
-                            p.kill()
+                        _signal_app(p)
+                        running.append(p)
+                    except Exception:
+                        pass
+            deadline = time.monotonic() + 2
+            for p in running:
+                try:
+                    p.wait(timeout=max(0, deadline - time.monotonic()))
+                except Exception:
+                    try:
+                        _signal_app(p, kill=True)
                     except Exception:
                         pass
             self.processes.clear()
@@ -1148,10 +1791,9 @@ class GroupLauncherWindow(tk.Toplevel):
         self.title("Group Launcher Settings")
         self.resizable(False, False)
 
-        self.mode_vars = {}  # group -> StringVar for dropdown
-        self.redis_key_vars = {}  # group -> StringVar for redis key:field
-        self.redis_entry_widgets = {}  # group -> Entry widget (to show/hide)
-        self.var_override = tk.IntVar(value=1 if app.data.get("autoStartGroupsOverride") else 0)
+        self.group_settings = {}  # group -> {"mode", "redisKey"} as edited; written back by save_settings
+        self._edit_group = None  # group the editor row is bound to
+        self.var_override = tk.IntVar(value=1 if app.data["autoStartGroupsOverride"] else 0)
 
         frm = ttk.Frame(self)
         frm.pack(fill="both", expand=True, padx=10, pady=10)
@@ -1165,12 +1807,16 @@ class GroupLauncherWindow(tk.Toplevel):
         self.var_redis_db = tk.StringVar(value=str(app.data.get("redisDb", 0)))
         self.var_redis_password = tk.StringVar(value=app.data.get("redisPassword", ""))
 
+        # port and db accept digits only, so save_settings always hands _normalize_settings a number (or "")
+        digits = (self.register(lambda text: text.isdigit() or text == ""), "%P")
         ttk.Label(redis_frame, text="Host:").grid(row=0, column=0, sticky="e", padx=4)
         ttk.Entry(redis_frame, textvariable=self.var_redis_host, width=15).grid(row=0, column=1, sticky="w", padx=4)
         ttk.Label(redis_frame, text="Port:").grid(row=0, column=2, sticky="e", padx=4)
-        ttk.Entry(redis_frame, textvariable=self.var_redis_port, width=8).grid(row=0, column=3, sticky="w", padx=4)
+        ttk.Entry(redis_frame, textvariable=self.var_redis_port, width=8,
+                  validate="key", validatecommand=digits).grid(row=0, column=3, sticky="w", padx=4)
         ttk.Label(redis_frame, text="DB:").grid(row=1, column=0, sticky="e", padx=4)
-        ttk.Entry(redis_frame, textvariable=self.var_redis_db, width=8).grid(row=1, column=1, sticky="w", padx=4)
+        ttk.Entry(redis_frame, textvariable=self.var_redis_db, width=8,
+                  validate="key", validatecommand=digits).grid(row=1, column=1, sticky="w", padx=4)
         ttk.Label(redis_frame, text="Password:").grid(row=1, column=2, sticky="e", padx=4)
         ttk.Entry(redis_frame, textvariable=self.var_redis_password, width=15, show="*").grid(row=1, column=3, sticky="w", padx=4)
 
@@ -1180,37 +1826,51 @@ class GroupLauncherWindow(tk.Toplevel):
         # Groups section
         ttk.Label(frm, text="Group Launch Control:", font=("", 10, "bold")).grid(row=1, column=0, sticky="w", pady=(10, 5))
 
+        # One Treeview row per group plus a single editor for the selected one: opening the
+        # window costs the same few widgets however many groups there are
         list_frame = ttk.Frame(frm)
         list_frame.grid(row=2, column=0, sticky="w")
 
         groups = self.app._get_groups()
-        group_modes = self.app.data.get("groupModes", {})
-        
-        r = 0
+        group_modes = self.app.data["groupModes"]
+
+        self.group_tree = ttk.Treeview(list_frame, columns=("mode", "redisKey"), show="tree headings",
+                                       height=max(1, min(15, len(groups))), selectmode="browse")
+        self.group_tree.heading("#0", text="Group")
+        self.group_tree.heading("mode", text="Mode")
+        self.group_tree.heading("redisKey", text="Redis key:field")
+        self.group_tree.column("#0", width=170)
+        self.group_tree.column("mode", width=70)
+        self.group_tree.column("redisKey", width=200)
+        self.group_tree.grid(row=0, column=0, sticky="w")
+        vsb = ttk.Scrollbar(list_frame, orient="vertical", command=self.group_tree.yview)
+        self.group_tree.configure(yscrollcommand=vsb.set)
+        vsb.grid(row=0, column=1, sticky="ns")
         for g in groups:
-            # Group name label
-            ttk.Label(list_frame, text=g, width=20).grid(row=r, column=0, sticky="w", padx=(0, 10), pady=4)
-            
-            # Mode dropdown
-            mode_var = tk.StringVar(value=group_modes.get(g, {}).get("mode", "off"))
-            mode_combo = ttk.Combobox(list_frame, textvariable=mode_var, values=["on", "off", "redis"], width=10, state="readonly")
-            mode_combo.grid(row=r, column=1, sticky="w", padx=4)
-            mode_combo.bind("<<ComboboxSelected>>", lambda e, gg=g: self.on_mode_change(gg))
-            self.mode_vars[g] = mode_var
-            
-            # Redis key:field entry (shown only when mode=redis)
-            redis_key = group_modes.get(g, {}).get("redisKey", "")
-            redis_var = tk.StringVar(value=redis_key)
-            redis_entry = ttk.Entry(list_frame, textvariable=redis_var, width=25)
-            redis_entry.grid(row=r, column=2, sticky="w", padx=4)
-            self.redis_key_vars[g] = redis_var
-            self.redis_entry_widgets[g] = redis_entry
-            
-            # Show/hide redis entry based on mode
-            if mode_var.get() != "redis":
-                redis_entry.grid_remove()
-            
-            r += 1
+            gm = group_modes.get(g, {})
+            settings = self.group_settings[g] = {"mode": gm.get("mode", "off"), "redisKey": gm.get("redisKey", "")}
+            self.group_tree.insert("", "end", iid=g, text=g, values=self._row_values(settings))
+        self.group_tree.bind("<<TreeviewSelect>>", lambda e: self.on_group_select())
+
+        edit_frame = ttk.Frame(list_frame)
+        edit_frame.grid(row=1, column=0, columnspan=2, sticky="w", pady=(6, 0))
+        # Group name label
+        self.var_edit_group = tk.StringVar(value="(select a group)")
+        ttk.Label(edit_frame, textvariable=self.var_edit_group, width=20).grid(row=0, column=0, sticky="w", padx=(0, 10))
+        # Mode dropdown
+        self.var_edit_mode = tk.StringVar()
+        self.mode_combo = ttk.Combobox(edit_frame, textvariable=self.var_edit_mode, values=["on", "off", "redis"],
+                                       width=10, state="disabled")
+        self.mode_combo.grid(row=0, column=1, sticky="w", padx=4)
+        self.mode_combo.bind("<<ComboboxSelected>>", lambda e: self.on_mode_change())
+        # Redis key:field entry (shown only when mode=redis)
+        self.var_edit_key = tk.StringVar()
+        self.redis_entry = ttk.Entry(edit_frame, textvariable=self.var_edit_key, width=25)
+        self.redis_entry.grid(row=0, column=2, sticky="w", padx=4)
+        self.redis_entry.grid_remove()
+        self.var_edit_key.trace_add("write", lambda *_: self._store_edit())
+        if groups:
+            self.group_tree.selection_set(groups[0])
 
         # Override checkbox
         ttk.Checkbutton(frm, text="On app launch, use these group settings (override per-app Auto Start)",
@@ -1226,57 +1886,82 @@ class GroupLauncherWindow(tk.Toplevel):
         self.transient(app)
         self.grab_set()
 
-    def on_mode_change(self, group: str):
+    @staticmethod
+    def _row_values(settings: dict):
+        return (settings["mode"], settings["redisKey"] if settings["mode"] == "redis" else "")
+
+    def on_group_select(self):
+        """Bind the editor row to the selected group"""
+        sel = self.group_tree.selection()
+        if not sel:
+            return
+        group = sel[0]
+        settings = self.group_settings[group]
+        # unbound while loading, so the previous group's values are not written over this one's
+        self._edit_group = None
+        self.var_edit_group.set(group)
+        self.var_edit_mode.set(settings["mode"])
+        self.var_edit_key.set(settings["redisKey"])
+        self._edit_group = group
+        self.mode_combo.configure(state="readonly")
+        self.on_mode_change()
+
+    def on_mode_change(self):
         """Show/hide Redis key entry based on mode selection"""
-        mode = self.mode_vars[group].get()
-        entry = self.redis_entry_widgets.get(group)
-        if entry:
-            if mode == "redis":
-                entry.grid()
-            else:
-                entry.grid_remove()
+        if self.var_edit_mode.get() == "redis":
+            self.redis_entry.grid()
+        else:
+            self.redis_entry.grid_remove()
+        self._store_edit()
+
+    def _store_edit(self):
+        group = self._edit_group
+        if group is None:
+            return
+        settings = self.group_settings[group]
+        settings["mode"] = self.var_edit_mode.get()
+        settings["redisKey"] = self.var_edit_key.get()
+        self.group_tree.item(group, values=self._row_values(settings))
 
     def on_apply(self):
         """Apply settings and start/update Redis monitor"""
         try:
             self.save_settings()
             self.app._start_redis_monitor()
-            messagebox.showinfo("Applied", "Settings applied and Redis monitor started/updated")
+            # status bar rather than a modal dialog: the Tk loop keeps running
+            self.app._set_status("Settings applied; Redis monitor is restarting")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to apply: {e}")
+            self.app._set_status(f"Failed to apply: {e}")
 
     def save_settings(self):
         """Save Redis and group mode settings"""
-        # Save Redis connection settings
-        try:
-            self.app.data["redisHost"] = self.var_redis_host.get().strip() or "localhost"
-            self.app.data["redisPort"] = int(self.var_redis_port.get() or 6379)
-            self.app.data["redisDb"] = int(self.var_redis_db.get() or 0)
-            self.app.data["redisPassword"] = self.var_redis_password.get().strip()
-        except Exception:
-            pass
+        # Save Redis connection settings, typed the same way as on load
+        self.app.data["redisHost"] = self.var_redis_host.get()
+        self.app.data["redisPort"] = self.var_redis_port.get()
+        self.app.data["redisDb"] = self.var_redis_db.get()
+        self.app.data["redisPassword"] = self.var_redis_password.get()
         
         # Save group modes
         group_modes = {}
-        for g, mode_var in self.mode_vars.items():
-            mode = mode_var.get()
-            redis_key = self.redis_key_vars[g].get().strip()
+        for g, settings in self.group_settings.items():
+            mode = settings["mode"]
+            redis_key = settings["redisKey"].strip()
             group_modes[g] = {
                 "mode": mode,
                 "redisKey": redis_key if mode == "redis" else ""
             }
         self.app.data["groupModes"] = group_modes
-        self.app.data["autoStartGroupsOverride"] = bool(int(self.var_override.get() or 0))
+        self.app.data["autoStartGroupsOverride"] = self.var_override.get() == 1
+        _normalize_settings(self.app.data)
 
     def on_save(self):
         """Save to launch.conf"""
         try:
             self.save_settings()
             save_profiles(self.app.data)
-            self.app.status.set("Saved group launch settings")
-            messagebox.showinfo("Saved", "Settings saved to launch.conf")
+            self.app._set_status(f"Saved group launch settings to {CONF_PATH.name}")
         except Exception as e:
-            messagebox.showerror("Save Failed", str(e))
+            self.app._set_status(f"Save failed: {e}")
 
     # (no background monitor methods here)
 
@@ -12,7 +12,14 @@ from pathlib import Path
 import re
 from urllib.parse import urlparse
 import json
-import platform
+import functools
+import shutil
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Base directory (absolute) to make paths robust regardless of current working directory.
 # When packaged as a single-file EXE (PyInstaller), use the executable's directory.
@@ -51,12 +58,29 @@ USV_WINDOW_TITLE = "无人船远程视频控制 - 白色主题"
 # Partial title to catch variations (e.g., different theme suffixes)
 USV_WINDOW_TITLE_PART = "无人船远程视频控制"
 SW_RESTORE = 9  # Minimal show/restore constant for ensuring window is not minimized before moving
+SW_MAXIMIZE = 3
+# Move windows in-process with SetWindowPos; MultiMonitorTool.exe is then only the fallback
+# (monitor numbering not certain, move not confirmed, or no window handle yet). False = always use MultiMonitorTool.
+DIRECT_WINDOW_MOVE = True
+SWP_NOSIZE = 0x0001
+SWP_NOZORDER = 0x0004
+SWP_SHOWWINDOW = 0x0040
+MONITOR_DEFAULTTONEAREST = 0x00000002
+
+_IS_WINDOWS = sys.platform.startswith("win")  # decided once; ping_host runs inside retry loops
 
 # Globals for cleanup
 _processes = []
 _browser_opened = False
 _browser_process = None
 
+# Persistent sockets reused by Redis liveness probes, one per (host, port) (see _pooled_redis_ping)
+_probe_socks = {}  # (host, port) -> connected socket
+_probe_locks = {}  # (host, port) -> lock held for a PING round-trip on that socket
+_probe_locks_guard = threading.Lock()  # only guards _probe_locks itself, never held during I/O
+PROBE_TIMEOUT = 0.5  # seconds per PING round-trip on the pooled socket
+TCP_PROBE_TIMEOUT = 0.3  # seconds for connect-only (tcp://, http(s)://) probes
+
 # Win32 helpers for minimal window control (F11 to toggle fullscreen)
 VK_F11 = 0x7A
 KEYEVENTF_KEYUP = 0x0002
@@ -65,25 +89,93 @@ user32 = ctypes.windll.user32
 kernel32 = ctypes.windll.kernel32
 
 EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, ctypes.c_void_p)
+# Declared once so each call skips argument guessing
+user32.EnumWindows.argtypes = [EnumWindowsProc, wintypes.LPARAM]
+user32.EnumWindows.restype = wintypes.BOOL
+user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+user32.EnumThreadWindows.argtypes = [wintypes.DWORD, EnumWindowsProc, wintypes.LPARAM]
+user32.EnumThreadWindows.restype = wintypes.BOOL
+user32.WaitForInputIdle.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+user32.WaitForInputIdle.restype = wintypes.DWORD
+user32.IsWindowVisible.argtypes = [wintypes.HWND]
+user32.IsWindowVisible.restype = wintypes.BOOL
+user32.IsIconic.argtypes = [wintypes.HWND]
+user32.IsIconic.restype = wintypes.BOOL
+user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+user32.GetWindowTextLengthW.restype = ctypes.c_int
+user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+user32.GetWindowTextW.restype = ctypes.c_int
+user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+user32.SetForegroundWindow.restype = wintypes.BOOL
+user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.ShowWindow.restype = wintypes.BOOL
+user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                                ctypes.c_int, ctypes.c_int, wintypes.UINT]
+user32.SetWindowPos.restype = wintypes.BOOL
+user32.keybd_event.argtypes = [wintypes.BYTE, wintypes.BYTE, wintypes.DWORD, ctypes.c_size_t]
+user32.keybd_event.restype = None
 
-def _enum_browser_windows(target_pid):
-    matches = []
-    def callback(hwnd, lParam):
-        # Skip invisible or minimized
-        if not user32.IsWindowVisible(hwnd):
-            return True
-        # Check process id
+# Console control handler + kernel waits used by main() to sleep until the control app exits
+HandlerRoutine = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.DWORD)
+kernel32.CreateEventW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+kernel32.CreateEventW.restype = wintypes.HANDLE
+kernel32.WaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD]
+kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.restype = wintypes.BOOL
+kernel32.SetConsoleCtrlHandler.argtypes = [HandlerRoutine, wintypes.BOOL]
+kernel32.SetConsoleCtrlHandler.restype = wintypes.BOOL
+INFINITE = 0xFFFFFFFF
+
+# Per-enumeration state for the shared callback; thread-local because the window workers enumerate concurrently
+_enum_state = threading.local()
+# pid -> id of the thread that owned the last window found for it; later lookups walk only that thread's windows
+_window_thread = {}
+
+
+def _enum_visible_callback(hwnd, lParam):
+    # Skip invisible or minimized
+    if not user32.IsWindowVisible(hwnd):
+        return True
+    # Check process id
+    filter_pid = _enum_state.filter_pid
+    if filter_pid is not None:
         pid = wintypes.DWORD()
         user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-        if pid.value != target_pid:
+        if pid.value != filter_pid:
             return True
-        # Basic heuristic: accept any visible top-level window of the process
-        matches.append(hwnd)
-        return True
-    user32.EnumWindows(EnumWindowsProc(callback), 0)
+    _enum_state.matches.append(hwnd)
+    return True
+
+# One callback thunk for the life of the process instead of a new one per enumeration;
+# the window waits enumerate every poll
+_ENUM_VISIBLE_CB = EnumWindowsProc(_enum_visible_callback)
+
+
+def _enum_visible(filter_pid: int | None = None):
+    """Visible top-level windows, optionally only those of process filter_pid."""
+    _enum_state.filter_pid = filter_pid
+    tid = _window_thread.get(filter_pid) if filter_pid is not None else None
+    if tid:
+        # the callback still checks the pid, so a recycled thread id just falls through to the full walk
+        _enum_state.matches = matches = []
+        user32.EnumThreadWindows(tid, _ENUM_VISIBLE_CB, 0)
+        if matches:
+            return matches
+    _enum_state.matches = matches = []
+    user32.EnumWindows(_ENUM_VISIBLE_CB, 0)
+    if matches and filter_pid is not None:
+        _window_thread[filter_pid] = user32.GetWindowThreadProcessId(matches[0], None)
     return matches
 
 
+def _enum_browser_windows(target_pid):
+    # Basic heuristic: accept any visible top-level window of the process
+    return _enum_visible(target_pid)
+
+
 def _enum_windows_for_pid(target_pid: int):
     """Enumerate visible top-level windows for the given process id."""
     return _enum_browser_windows(target_pid)
@@ -103,29 +195,32 @@ def wait_for_window_of_process(pid: int, timeout: float = 60.0, poll: float = 0.
     return False
 
 
+def wait_for_input_idle(proc: subprocess.Popen, timeout: float) -> bool:
+    """Block (in the kernel, no polling) until proc's GUI has started and waits for input.
+
+    False on timeout, or when proc has no message loop to wait for (console apps), so callers
+    fall back to polling for the window.
+    """
+    try:
+        return user32.WaitForInputIdle(int(proc._handle), int(timeout * 1000)) == 0
+    except Exception:
+        return False
+
+
 def dump_visible_window_titles(filter_pid: int | None = None):
     """Print visible top-level window titles (optionally only for a given pid)."""
-    def callback(hwnd, lParam):
-        if not user32.IsWindowVisible(hwnd):
-            return True
-        if filter_pid is not None:
-            pid = wintypes.DWORD()
-            user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-            if pid.value != filter_pid:
-                return True
+    for hwnd in _enum_visible(filter_pid):
         length = user32.GetWindowTextLengthW(hwnd)
         if length <= 0:
-            return True
+            continue
         buf = ctypes.create_unicode_buffer(length + 1)
         user32.GetWindowTextW(hwnd, buf, length + 1)
         title = buf.value.strip()
         if title:
             print(f"Window: {title}")
-        return True
-    user32.EnumWindows(EnumWindowsProc(callback), 0)
 
 def enforce_fullscreen_async():
-    """Spawn thread to wait for browser window then toggle fullscreen and move via MultiMonitorTool."""
+    """Spawn thread to wait for browser window, move it to the chart monitor (directly, else via MultiMonitorTool) and toggle fullscreen."""
     def worker():
         if _browser_process is None:
             return
@@ -142,6 +237,8 @@ def enforce_fullscreen_async():
             time.sleep(0.5)
         if hwnd is None:
             return
+        # Place it on the chart monitor first, so fullscreen then happens there
+        moved = move_window_to_monitor(hwnd, MULTIMON_CHART_MONITOR)
         # Try to force true fullscreen by sending F11
         try:
             user32.SetForegroundWindow(hwnd)
@@ -151,142 +248,383 @@ def enforce_fullscreen_async():
         except Exception:
             pass
 
-        # Additionally, use MultiMonitorTool to move by Title to desired monitor
+        if moved:
+            return
+        # Otherwise use MultiMonitorTool to move by Title to desired monitor
         try:
             # First try moving any Edge window by process name (useful if title not ready or warning page shown)
             move_window_with_multimonitor(MULTIMON_CHART_MONITOR, kind="Process", value="msedge.exe", retries=20, delay=0.5)
-            # Then try by title for a while to catch when page title appears
-            if not move_window_with_multimonitor(MULTIMON_CHART_MONITOR, kind="Title", value=CHART_WINDOW_TITLE, retries=40, delay=0.5):
-                move_window_with_multimonitor(MULTIMON_CHART_MONITOR, kind="Title", value=CHART_WINDOW_TITLE_ALT, retries=20, delay=0.5)
+            # Then try by title (full or alternate) for a while to catch when page title appears
+            move_window_with_multimonitor_any(MULTIMON_CHART_MONITOR, [("Title", CHART_WINDOW_TITLE),
+                                                                       ("Title", CHART_WINDOW_TITLE_ALT)],
+                                              retries=40, delay=0.5)
         except Exception:
             pass
     threading.Thread(target=worker, daemon=True).start()
 
 
+class MONITORINFOEXW(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("rcMonitor", wintypes.RECT),
+        ("rcWork", wintypes.RECT),
+        ("dwFlags", wintypes.DWORD),
+        ("szDevice", wintypes.WCHAR * 32),
+    ]
+
+
+MonitorEnumProc = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HMONITOR, wintypes.HDC,
+                                     ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+user32.EnumDisplayMonitors.argtypes = [wintypes.HDC, ctypes.POINTER(wintypes.RECT), MonitorEnumProc, wintypes.LPARAM]
+user32.EnumDisplayMonitors.restype = wintypes.BOOL
+user32.GetMonitorInfoW.argtypes = [wintypes.HMONITOR, ctypes.POINTER(MONITORINFOEXW)]
+user32.GetMonitorInfoW.restype = wintypes.BOOL
+user32.MonitorFromWindow.argtypes = [wintypes.HWND, wintypes.DWORD]
+user32.MonitorFromWindow.restype = wintypes.HMONITOR
+user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+user32.GetWindowRect.restype = wintypes.BOOL
+user32.IsZoomed.argtypes = [wintypes.HWND]
+user32.IsZoomed.restype = wintypes.BOOL
+
+
+def _monitor_rects():
+    """{display number: (hmonitor, (left, top, right, bottom))}, numbered by the \\\\.\\DISPLAYn suffix."""
+    rects = {}
+    def callback(hmon, hdc, lprect, lparam):
+        info = MONITORINFOEXW()
+        info.cbSize = ctypes.sizeof(MONITORINFOEXW)
+        if user32.GetMonitorInfoW(hmon, ctypes.byref(info)):
+            m = re.search(r"(\d+)$", info.szDevice)
+            if m:
+                rc = info.rcMonitor
+                rects[int(m.group(1))] = (hmon, (rc.left, rc.top, rc.right, rc.bottom))
+        return True
+    user32.EnumDisplayMonitors(None, None, MonitorEnumProc(callback), 0)
+    return rects
+
+
+def move_window_to_monitor(hwnd, monitor_number: int) -> bool:
+    """Move hwnd to monitor monitor_number with SetWindowPos; no MultiMonitorTool process.
+
+    Like MultiMonitorTool's /MoveWindow this only relocates the window: its size and its offset from
+    the monitor's top-left corner are kept (a maximized window is maximized again on the new monitor).
+    Returns False (so callers can fall back to MultiMonitorTool) when the monitor number can't be mapped
+    with certainty, i.e. the DISPLAYn suffixes are not exactly 1..N, or when the window did not land there.
+    """
+    if not DIRECT_WINDOW_MOVE or not hwnd:
+        return False
+    try:
+        monitors = _monitor_rects()
+        # With gaps in the DISPLAYn numbering MultiMonitorTool's numbers may not match the suffixes
+        if sorted(monitors) != list(range(1, len(monitors) + 1)) or monitor_number not in monitors:
+            return False
+        target_hmon, (left, top, right, bottom) = monitors[monitor_number]
+        zoomed = bool(user32.IsZoomed(hwnd))
+        if zoomed or user32.IsIconic(hwnd):
+            user32.ShowWindow(hwnd, SW_RESTORE)
+        win = wintypes.RECT()
+        if not user32.GetWindowRect(hwnd, ctypes.byref(win)):
+            return False
+        # Offset from the top-left of the monitor the window is on now
+        cur = MONITORINFOEXW()
+        cur.cbSize = ctypes.sizeof(MONITORINFOEXW)
+        if user32.GetMonitorInfoW(user32.MonitorFromWindow(hwnd, MONITOR_DEFAULTTONEAREST), ctypes.byref(cur)):
+            dx, dy = win.left - cur.rcMonitor.left, win.top - cur.rcMonitor.top
+        else:
+            dx, dy = 0, 0
+        # Keep the top-left corner on the target monitor even if it is smaller than the current one
+        x = left + max(0, min(dx, right - left - 1))
+        y = top + max(0, min(dy, bottom - top - 1))
+        if not user32.SetWindowPos(hwnd, None, x, y, 0, 0, SWP_NOSIZE | SWP_NOZORDER | SWP_SHOWWINDOW):
+            return False
+        if zoomed:
+            user32.ShowWindow(hwnd, SW_MAXIMIZE)
+        if user32.MonitorFromWindow(hwnd, MONITOR_DEFAULTTONEAREST) != target_hmon:
+            return False
+        print(f"[Move] Window {hwnd} -> monitor {monitor_number}")
+        return True
+    except Exception:
+        return False
+
+
 def move_window_with_multimonitor(monitor_number: int, kind: str, value: str, retries: int = 8, delay: float = 0.5):
     """Use MultiMonitorTool.exe to move a window to a monitor.
 
     kind: 'Process' or 'Title' (see NirSoft MultiMonitorTool docs)
     value: process name (e.g., 'usv_remote_ctrl.exe') or partial/exact title
     """
+    return move_window_with_multimonitor_any(monitor_number, [(kind, value)], retries=retries, delay=delay)
+
+
+def move_window_with_multimonitor_any(monitor_number: int, targets, retries: int = 8, delay: float = 0.5):
+    """Like move_window_with_multimonitor, but tries every (kind, value) in targets each round.
+
+    The first match that succeeds ends it, so a fallback (bare process name, alternate
+    title) gets its turn within one delay instead of after the earlier ones exhaust their retries.
+    """
     if not MULTIMON_EXE.exists():
         print(f"MultiMonitorTool not found at {MULTIMON_EXE}")
         return False
-    print(f"[MMT] Move request: monitor={monitor_number}, {kind}={value}, retries={retries}, delay={delay}s")
-    ok = False
+    desc = ", ".join(f"{kind}={value}" for kind, value in targets)
+    print(f"[MMT] Move request: monitor={monitor_number}, {desc}, retries={retries}, delay={delay}s")
     for _ in range(max(1, retries)):
-        try:
-            cmd = [str(MULTIMON_EXE), "/MoveWindow", str(monitor_number), kind, value]
-            res = subprocess.run(cmd, cwd=str(BASE_DIR), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            if res.returncode == 0:
-                ok = True
-                break
-        except Exception:
-            pass
+        for kind, value in targets:
+            try:
+                cmd = [str(MULTIMON_EXE), "/MoveWindow", str(monitor_number), kind, value]
+                res = subprocess.run(cmd, cwd=str(BASE_DIR), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                if res.returncode == 0:
+                    print(f"[MMT] Move success: {kind}={value} -> monitor {monitor_number}")
+                    return True
+            except Exception:
+                pass
         time.sleep(delay)
-    if not ok:
-        print(f"MultiMonitorTool move failed for {kind}={value} to monitor {monitor_number}")
-    else:
-        print(f"[MMT] Move success: {kind}={value} -> monitor {monitor_number}")
-    return ok
+    print(f"MultiMonitorTool move failed for {desc} to monitor {monitor_number}")
+    return False
 
 
 def wait_for_port(port: int, host: str = "127.0.0.1", timeout: int = PORT_TIMEOUT) -> bool:
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
-            try:
-                s.connect((host, port))
+    """Wait until host:port accepts a TCP connection; returns False once timeout elapses.
+
+    A closed port refuses at once, so attempts start 50 ms apart and back off to 0.5 s:
+    a port that opens early is seen within a few ms instead of up to half a second later.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if _tcp_probe(host, port, timeout=min(1.0, remaining)):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(0.5, delay * 2)
+
+
+def check_redis_connectivity(host: str, port: int, timeout: float = 2.0) -> bool:
+    """Attempt a Redis PING using RESP protocol; returns True on +PONG.
+
+    Goes over the persistent probe socket, so repeated checks cost one round-trip, not a new connection each.
+    """
+    return _pooled_redis_ping(host, port, timeout)
+
+
+# (host, port) -> getaddrinfo result; an entry is dropped when its target stops accepting connections
+_ADDR_CACHE = {}
+_ADDR_LOCK = threading.Lock()
+
+
+def _cached_getaddrinfo(host: str, port: int):
+    """getaddrinfo for TCP streams, memoized per (host, port) so repeated probes skip name resolution."""
+    key = (host, port)
+    with _ADDR_LOCK:
+        hit = _ADDR_CACHE.get(key)
+    if hit is not None:
+        return hit
+    infos = tuple(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+    with _ADDR_LOCK:
+        _ADDR_CACHE[key] = infos
+    return infos
+
+
+def _tcp_probe(host: str, port: int, timeout: float = TCP_PROBE_TIMEOUT) -> bool:
+    """Return True if a TCP connection to host:port can be opened; the socket is closed immediately.
+
+    Addresses come from _cached_getaddrinfo; this target's entry is dropped when none of them
+    accept a connection so a changed DNS record is picked up on the next probe.
+    """
+    try:
+        infos = _cached_getaddrinfo(host, port)
+    except OSError:
+        return False
+    for family, socktype, proto, _, addr in infos:
+        try:
+            with socket.socket(family, socktype, proto) as s:
+                s.settimeout(timeout)
+                s.connect(addr)
                 return True
-            except OSError:
-                time.sleep(0.5)
+        except OSError:
+            continue
+    with _ADDR_LOCK:
+        _ADDR_CACHE.pop((host, port), None)
     return False
 
 
-def check_redis_connectivity(host: str, port: int, timeout: float = 2.0) -> bool:
-    """Attempt a Redis PING using RESP protocol; returns True on +PONG."""
+def _close_probe_sock(addr):
+    sock = _probe_socks.pop(addr, None)
     try:
-        with socket.create_connection((host, port), timeout=timeout) as s:
-            # RESP array of 1 bulk string: PING
-            s.sendall(b"*1\r\n$4\r\nPING\r\n")
-            s.settimeout(timeout)
-            data = s.recv(256)
-            if not data:
-                return False
-            # Expect +PONG\r\n
-            return data.startswith(b"+PONG")
+        if sock is not None:
+            sock.close()
     except OSError:
+        pass
+
+
+def _pooled_redis_ping(host: str, port: int, timeout: float = PROBE_TIMEOUT) -> bool:
+    """Redis PING over a persistent socket for (host, port); reconnects once if it is stale.
+
+    Probes of different targets run concurrently; only probes of the same target share a socket and wait on each other.
+    """
+    addr = (host, port)
+    with _probe_locks_guard:
+        lock = _probe_locks.get(addr)
+        if lock is None:
+            lock = _probe_locks[addr] = threading.Lock()
+    with lock:
+        for _ in range(2):
+            try:
+                sock = _probe_socks.get(addr)
+                if sock is None:
+                    sock = _probe_socks[addr] = socket.create_connection(addr, timeout=timeout)
+                sock.settimeout(timeout)
+                sock.sendall(b"*1\r\n$4\r\nPING\r\n")
+                data = sock.recv(256)
+                if data.startswith(b"+PONG"):
+                    return True
+                # Empty read means the server closed the connection; anything else is not a PONG
+                _close_probe_sock(addr)
+                if data:
+                    return False
+            except OSError:
+                _close_probe_sock(addr)
         return False
 
 
-def _can_reach(ping_target: str) -> bool:
-    """Return True if ping_target is reachable.
-
-    Preference order:
-    - If target is redis://host[:port], perform Redis PING handshake.
-    - If target is tcp://host:port, attempt a raw TCP connect to host:port.
-    - If target is http(s)://, attempt TCP connect to its host:port.
-    - If target is ping://host, perform an ICMP ping via OS ping command.
-    - If target has no scheme, prefer a simple ICMP ping to the host; if of the form host:port, fall back to Redis PING (backward compatibility).
+def _unreachable() -> bool:
+    return False
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_target(ping_target: str):
+    """Parse ping_target once into the (check, args) pair _can_reach calls on every attempt.
+
+    - redis://host[:port] -> Redis PING handshake.
+    - tcp://host:port -> raw TCP connect to host:port.
+    - http(s)://host[:port] -> TCP connect to its host:port.
+    - ping://host -> ICMP ping (ping_host).
+    - No scheme: a pure host/ip is pinged; host:port falls back to Redis PING (backward compatibility).
+    Targets that can't be checked (missing host/port, bad port) map to a check that is always False.
     """
     try:
         parsed = urlparse(ping_target)
         if parsed.scheme == "redis":
-            host = parsed.hostname
-            port = parsed.port or 6379
-            if not host:
-                return False
-            return check_redis_connectivity(host, port)
+            if not parsed.hostname:
+                return _unreachable, ()
+            return _pooled_redis_ping, (parsed.hostname, parsed.port or 6379)
         if parsed.scheme == "ping":
             host = parsed.hostname or ping_target.replace("ping://", "", 1)
             if not host:
-                return False
-            return ping_host(host)
+                return _unreachable, ()
+            return ping_host, (host,)
         if parsed.scheme == "tcp":
-            host = parsed.hostname
-            port = parsed.port
-            if not host or not port:
-                return False
-            try:
-                with socket.create_connection((host, port), timeout=2):
-                    return True
-            except OSError:
-                return False
+            if not parsed.hostname or not parsed.port:
+                return _unreachable, ()
+            return _tcp_probe, (parsed.hostname, parsed.port)
         if parsed.scheme in ("http", "https"):
-            host = parsed.hostname
-            if not host:
-                return False
-            port = parsed.port or (443 if parsed.scheme == "https" else 80)
-            try:
-                with socket.create_connection((host, port), timeout=2):
-                    return True
-            except OSError:
-                return False
+            if not parsed.hostname:
+                return _unreachable, ()
+            return _tcp_probe, (parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80))
         # No scheme
         # If pure host/ip, prefer ICMP ping
         if ":" not in ping_target:
-            return ping_host(ping_target)
+            return ping_host, (ping_target,)
         # host:port retained for backward compatibility with Redis checks
         host, p = ping_target.split(":", 1)
         try:
             port = int(p)
         except Exception:
             port = 6379
-        return check_redis_connectivity(host, port)
+        return _pooled_redis_ping, (host, port)
+    except Exception:
+        return _unreachable, ()
+
+
+def _can_reach(ping_target: str) -> bool:
+    """Return True if ping_target is reachable (see _compile_target for the accepted forms)."""
+    try:
+        check, args = _compile_target(ping_target)
+        return check(*args)
     except Exception:
         return False
 
 
+class IP_OPTION_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("Ttl", ctypes.c_ubyte),
+        ("Tos", ctypes.c_ubyte),
+        ("Flags", ctypes.c_ubyte),
+        ("OptionsSize", ctypes.c_ubyte),
+        ("OptionsData", ctypes.c_void_p),
+    ]
+
+
+class ICMP_ECHO_REPLY(ctypes.Structure):
+    _fields_ = [
+        ("Address", ctypes.c_ulong),
+        ("Status", ctypes.c_ulong),
+        ("RoundTripTime", ctypes.c_ulong),
+        ("DataSize", ctypes.c_ushort),
+        ("Reserved", ctypes.c_ushort),
+        ("Data", ctypes.c_void_p),
+        ("Options", IP_OPTION_INFORMATION),
+    ]
+
+
+iphlpapi = ctypes.windll.iphlpapi
+iphlpapi.IcmpCreateFile.restype = wintypes.HANDLE
+iphlpapi.IcmpSendEcho.argtypes = [wintypes.HANDLE, ctypes.c_ulong, ctypes.c_void_p, wintypes.WORD,
+                                  ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD, wintypes.DWORD]
+iphlpapi.IcmpSendEcho.restype = wintypes.DWORD
+_ICMP_PAYLOAD = b"duallauncher ping"
+# ICMP handle shared by every in-process echo (created on first use)
+_icmp_handle = None
+_icmp_lock = threading.Lock()
+
+
+def _icmp_echo(host: str, count: int, timeout: int):
+    """ICMP echo to host from inside this process via iphlpapi (no ping.exe spawn).
+
+    True if any of count echoes is answered with IP_SUCCESS, False if none are; None when the
+    in-process path can't be used (no IPv4 address, no ICMP handle) so the caller runs ping.exe.
+    """
+    global _icmp_handle
+    try:
+        ip = next((info[4][0] for info in _cached_getaddrinfo(host, 0) if info[0] == socket.AF_INET), None)
+        if ip is None:
+            return None
+        with _icmp_lock:
+            if _icmp_handle is None:
+                handle = iphlpapi.IcmpCreateFile()
+                if not handle or handle == ctypes.c_void_p(-1).value:
+                    return None
+                _icmp_handle = handle
+        # IPAddr is the address in network byte order, read as a little-endian ULONG
+        dest = int.from_bytes(socket.inet_aton(ip), "little")
+        reply = ctypes.create_string_buffer(ctypes.sizeof(ICMP_ECHO_REPLY) + len(_ICMP_PAYLOAD) + 8)
+        for _ in range(max(1, count)):
+            if iphlpapi.IcmpSendEcho(_icmp_handle, dest, _ICMP_PAYLOAD, len(_ICMP_PAYLOAD), None,
+                                     reply, ctypes.sizeof(reply), timeout * 1000):
+                if ICMP_ECHO_REPLY.from_buffer(reply).Status == 0:
+                    return True
+        return False
+    except Exception:
+        return None
+
+
 def ping_host(host: str, count: int = 1, timeout: int = 2) -> bool:
-    """Ping a host using the OS ping command.
+    """Ping a host.
 
-    On Windows, use `ping -n <count> -w <timeout_ms> <host>`.
-    Returns True if exit code is 0.
+    On Windows, send the echoes in-process through iphlpapi (_icmp_echo), falling back to
+    `ping -n <count> -w <timeout_ms> <host>`; elsewhere use the OS ping command.
+    Returns True on a reply (for the ping command: if exit code is 0).
     """
+    if _IS_WINDOWS:
+        ok = _icmp_echo(host, count, timeout)
+        if ok is not None:
+            return ok
     try:
-        system = platform.system().lower()
-        if system.startswith("windows"):
+        if _IS_WINDOWS:
             # timeout in ms; -w is per-echo timeout on Windows
             cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000), host]
         else:
@@ -321,76 +659,170 @@ def wait_for_connectivity(ping_target: str, total_timeout: int = PING_TOTAL_TIME
         if total_timeout and (time.time() - start) >= total_timeout:
             print(f"Connectivity check timed out after {total_timeout}s for {ping_target}.")
             return False
-        time.sleep(interval)
+        # Sleep on the cancel event itself so set() interrupts the wait immediately
+        if cancel_event is not None and hasattr(cancel_event, 'wait'):
+            if cancel_event.wait(interval):
+                print("Connectivity check canceled.")
+                return False
+        else:
+            time.sleep(interval)
+
+
+EDGE_PATHS = (
+    "msedge",
+    "C:/Program Files/Microsoft/Edge/Application/msedge.exe",
+    "C:/Program Files (x86)/Microsoft/Edge/Application/msedge.exe",
+)
+# Edge arguments that don't depend on the URL (avoid kiosk/InPrivate; use app mode + dedicated profile)
+EDGE_COMMON_ARGS = (
+    f"--user-data-dir={BASE_DIR / 'edge_profile'}",
+    "--no-first-run",
+    "--disable-first-run-ui",
+    # Make sure HTTPS-only / private network blocks don't interfere for HTTP URLs
+    "--disable-features=BlockInsecurePrivateNetworkRequests,EdgeHttpsOnlyMode,HttpsUpgrades",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _edge_exe():
+    """First EDGE_PATHS entry that exists (bare names looked up on PATH), or None; resolved once."""
+    for edge in EDGE_PATHS:
+        found = shutil.which(edge) if not os.path.isabs(edge) else (edge if os.path.isfile(edge) else None)
+        if found:
+            return found
+    return None
 
 
 def open_browser_fullscreen(url: str):
     global _browser_opened, _browser_process
-    # Build Edge commands (avoid kiosk/InPrivate; use app mode + dedicated profile)
-    browser_cmds = []
-    if CHART_BROWSER.lower() in ("edge", "msedge", ""):
-        edge_paths = [
-            "msedge",
-            "C:/Program Files/Microsoft/Edge/Application/msedge.exe",
-            "C:/Program Files (x86)/Microsoft/Edge/Application/msedge.exe",
-        ]
-        profile_dir = BASE_DIR / "edge_profile"
-        common = [
-            f"--user-data-dir={profile_dir}",
-            "--no-first-run",
-            "--disable-first-run-ui",
-            # Make sure HTTPS-only / private network blocks don't interfere for HTTP URLs
-            "--disable-features=BlockInsecurePrivateNetworkRequests,EdgeHttpsOnlyMode,HttpsUpgrades",
-        ]
-        for edge in edge_paths:
-            # App mode fullscreen (preferred)
-            browser_cmds.append([
-                edge,
-                f"--app={url}",
-                "--start-fullscreen",
-                *common,
-            ])
-            # Plain url with fullscreen
-            browser_cmds.append([
-                edge,
-                url,
-                "--start-fullscreen",
-                *common,
-            ])
-
-    for cmd in browser_cmds:
+    edge = _edge_exe() if CHART_BROWSER.lower() in ("edge", "msedge", "") else None
+    if edge:
+        # App mode fullscreen
+        cmd = (edge, f"--app={url}", "--start-fullscreen", *EDGE_COMMON_ARGS)
         try:
-            print(f"Attempting to launch browser with command: {' '.join(cmd)}")
             _browser_process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             _browser_opened = True
             try:
                 # Track the browser like other child processes so terminate_children() will close it
                 _processes.append(_browser_process)
+                _assign_to_job(_browser_process)
             except Exception:
                 pass
             print(f"Launched browser with command: {' '.join(cmd)}")
             enforce_fullscreen_async()
             return
-        except FileNotFoundError:
-            continue
+        except OSError as e:
+            print(f"Browser launch failed ({e}): {' '.join(cmd)}")
+            # removed since it was resolved: look again next time
+            _edge_exe.cache_clear()
     # Fallback
     print("Falling back to default system browser (manual fullscreen may be required).")
     webbrowser.open(url)
     _browser_opened = True
 
 
+class IO_COUNTERS(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_ulonglong) for name in (
+        "ReadOperationCount", "WriteOperationCount", "OtherOperationCount",
+        "ReadTransferCount", "WriteTransferCount", "OtherTransferCount")]
+
+
+class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("PerProcessUserTimeLimit", ctypes.c_longlong),
+        ("PerJobUserTimeLimit", ctypes.c_longlong),
+        ("LimitFlags", wintypes.DWORD),
+        ("MinimumWorkingSetSize", ctypes.c_size_t),
+        ("MaximumWorkingSetSize", ctypes.c_size_t),
+        ("ActiveProcessLimit", wintypes.DWORD),
+        ("Affinity", ctypes.c_size_t),
+        ("PriorityClass", wintypes.DWORD),
+        ("SchedulingClass", wintypes.DWORD),
+    ]
+
+
+class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("BasicLimitInformation", JOBOBJECT_BASIC_LIMIT_INFORMATION),
+        ("IoInfo", IO_COUNTERS),
+        ("ProcessMemoryLimit", ctypes.c_size_t),
+        ("JobMemoryLimit", ctypes.c_size_t),
+        ("PeakProcessMemoryUsed", ctypes.c_size_t),
+        ("PeakJobMemoryUsed", ctypes.c_size_t),
+    ]
+
+
+JobObjectExtendedLimitInformation = 9
+JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+PROCESS_TERMINATE = 0x0001
+PROCESS_SET_QUOTA = 0x0100
+kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+kernel32.SetInformationJobObject.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+kernel32.SetInformationJobObject.restype = wintypes.BOOL
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.OpenProcess.restype = wintypes.HANDLE
+kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+kernel32.AssignProcessToJobObject.restype = wintypes.BOOL
+kernel32.TerminateJobObject.argtypes = [wintypes.HANDLE, wintypes.UINT]
+kernel32.TerminateJobObject.restype = wintypes.BOOL
+# Job Object holding every child we launch (created on first use). Its handle is never closed:
+# KILL_ON_JOB_CLOSE then also takes the children down if the launcher itself dies.
+_job_handle = None
+_job_lock = threading.Lock()
+_job_members = set()  # pids successfully assigned to the job; only these die with TerminateJobObject
+
+
+def _assign_to_job(proc: subprocess.Popen) -> bool:
+    """Put proc (and so everything it spawns later) into the launcher's Job Object; False if that fails."""
+    global _job_handle
+    if not _IS_WINDOWS:
+        return False
+    try:
+        with _job_lock:
+            if _job_handle is None:
+                job = kernel32.CreateJobObjectW(None, None)
+                if not job:
+                    return False
+                info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+                info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+                if not kernel32.SetInformationJobObject(job, JobObjectExtendedLimitInformation,
+                                                        ctypes.byref(info), ctypes.sizeof(info)):
+                    kernel32.CloseHandle(job)
+                    return False
+                _job_handle = job
+        h = kernel32.OpenProcess(PROCESS_SET_QUOTA | PROCESS_TERMINATE, False, proc.pid)
+        if not h:
+            return False
+        try:
+            if not kernel32.AssignProcessToJobObject(_job_handle, h):
+                return False
+            _job_members.add(proc.pid)
+            return True
+        finally:
+            kernel32.CloseHandle(h)
+    except Exception:
+        return False
+
+
 def launch_process(path: Path):
     if not path.exists():
         raise FileNotFoundError(f"Executable not found: {path}")
     env = os.environ.copy()
     p = subprocess.Popen([str(path)], cwd=str(path.parent), env=env)
     _processes.append(p)
+    _assign_to_job(p)
     # If this is the USV control app, wait for its window, then move via MultiMonitorTool
     try:
         if path.name.lower() == "usv_remote_ctrl.exe":
             def _move_ctrl():
-                # Wait explicitly for a window to show up
-                waited_ok = wait_for_window_of_process(p.pid, timeout=WINDOW_WAIT_TIMEOUT_USV, poll=WINDOW_POLL_INTERVAL)
+                # Wait explicitly for a window to show up: first in the kernel until the app is idle for input
+                # (its main window normally exists by then), polling only for what remains of the timeout
+                start = time.monotonic()
+                waited_ok = wait_for_input_idle(p, WINDOW_WAIT_TIMEOUT_USV) and bool(_enum_windows_for_pid(p.pid))
+                if not waited_ok:
+                    remaining = max(0.0, WINDOW_WAIT_TIMEOUT_USV - (time.monotonic() - start))
+                    waited_ok = wait_for_window_of_process(p.pid, timeout=remaining, poll=WINDOW_POLL_INTERVAL)
                 if not waited_ok:
                     print(f"USV window did not appear within {WINDOW_WAIT_TIMEOUT_USV}s; will still attempt move via MultiMonitorTool.")
                     try:
@@ -399,6 +831,7 @@ def launch_process(path: Path):
                     except Exception:
                         pass
                 # Try to restore the window (if minimized) before moving
+                wins = []
                 try:
                     wins = _enum_windows_for_pid(p.pid)
                     if wins:
@@ -409,17 +842,17 @@ def launch_process(path: Path):
                             pass
                 except Exception:
                     pass
-                # First try moving by process name
-                ok = move_window_with_multimonitor(MULTIMON_CTRL_MONITOR, "Process", "usv_remote_ctrl.exe", retries=40, delay=0.5)
-                # Try without .exe as some tools accept bare process name
-                if not ok:
-                    ok = move_window_with_multimonitor(MULTIMON_CTRL_MONITOR, "Process", "usv_remote_ctrl", retries=20, delay=0.5)
-                # Then try by known window title as a fallback
-                if not ok:
-                    ok = move_window_with_multimonitor(MULTIMON_CTRL_MONITOR, "Title", USV_WINDOW_TITLE, retries=40, delay=0.5)
-                # Finally, try by partial title in case theme suffix differs
-                if not ok:
-                    move_window_with_multimonitor(MULTIMON_CTRL_MONITOR, "Title", USV_WINDOW_TITLE_PART, retries=40, delay=0.5)
+                # Move it directly when we have its handle; MultiMonitorTool is the fallback
+                if wins and move_window_to_monitor(wins[0], MULTIMON_CTRL_MONITOR):
+                    return
+                # Each round tries the process name, the bare process name (some tools accept it),
+                # the known window title and the partial title (theme suffix may differ)
+                move_window_with_multimonitor_any(MULTIMON_CTRL_MONITOR, [
+                    ("Process", "usv_remote_ctrl.exe"),
+                    ("Process", "usv_remote_ctrl"),
+                    ("Title", USV_WINDOW_TITLE),
+                    ("Title", USV_WINDOW_TITLE_PART),
+                ], retries=40, delay=0.5)
             threading.Thread(target=_move_ctrl, daemon=True).start()
     except Exception:
         pass
@@ -434,15 +867,23 @@ def graceful_shutdown(*_):
 
 def terminate_children():
     """Terminate any child processes we launched."""
+    # One call ends everything in the Job Object, grandchildren included; taskkill below is
+    # then only spawned for children that could not be assigned (or are somehow still running)
+    try:
+        if _job_handle and kernel32.TerminateJobObject(_job_handle, 1):
+            # Children that could not be assigned are still running; don't stall on them here
+            for p in _processes:
+                if p.pid in _job_members:
+                    try:
+                        p.wait(timeout=2)
+                    except Exception:
+                        pass
+    except Exception:
+        pass
     for p in list(_processes):
         terminate_process_tree(p)
-    # Clear out dead processes
-    for p in list(_processes):
-        if p.poll() is not None:
-            try:
-                _processes.remove(p)
-            except Exception:
-                pass
+    # Clear out dead processes: rebuilt in one pass rather than remove()d one by one
+    _processes[:] = [p for p in _processes if p.poll() is None]
     # Also make sure browser process is gone, even if it wasn't tracked earlier
     global _browser_process, _browser_opened
     try:
@@ -498,6 +939,55 @@ def start_sequence(start_ctrl: bool = True, start_chart_backend: bool = False, o
     return ctrl_proc, chart_proc
 
 
+def _wait_for_exit(proc: subprocess.Popen):
+    """Block until proc exits or the console gets Ctrl+C/close, with no periodic wakeups.
+
+    The process handle and an event set from a console control handler (which Windows runs on
+    its own thread, so it fires even while this thread is blocked) are waited on together.
+    The handler returns False, so Python's SIGINT handling (graceful_shutdown) still follows.
+    """
+    stop_event = kernel32.CreateEventW(None, True, False, None) if _IS_WINDOWS else None
+    if not stop_event:
+        # no kernel event to wait on: a sliced wait still returns the moment proc exits
+        while True:
+            try:
+                proc.wait(timeout=1)
+                return
+            except subprocess.TimeoutExpired:
+                pass
+
+    def on_console_event(ctrl_type):
+        kernel32.SetEvent(stop_event)
+        return False
+    handler = HandlerRoutine(on_console_event)  # referenced until unregistered below
+    kernel32.SetConsoleCtrlHandler(handler, True)
+    try:
+        handles = (wintypes.HANDLE * 2)(int(proc._handle), stop_event)
+        kernel32.WaitForMultipleObjects(2, handles, False, INFINITE)
+    finally:
+        kernel32.SetConsoleCtrlHandler(handler, False)
+        kernel32.CloseHandle(stop_event)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config(stamp):
+    # stamp = (mtime_ns, size) of config.json: a changed file misses the cache and is parsed again
+    data = CONFIG_PATH.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def load_config() -> dict:
+    """Parsed apps/config.json ({} if missing or invalid); parsed again only after the file changes."""
+    try:
+        st = CONFIG_PATH.stat()
+        cfg = _read_config((st.st_mtime_ns, st.st_size))
+    except Exception:
+        return {}
+    return cfg if isinstance(cfg, dict) else {}
+
+
 def main():
     signal.signal(signal.SIGINT, graceful_shutdown)
     if hasattr(signal, 'SIGTERM'):
@@ -506,17 +996,15 @@ def main():
     # Load config.json (if present) and determine ping target (redis host:port or ping_url)
     ping_target = PING_URL
     try:
-        if CONFIG_PATH.exists():
-            with CONFIG_PATH.open("r", encoding="utf-8") as f:
-                cfg = json.load(f)
-            # prefer explicit ping_url if present
-            if isinstance(cfg, dict) and cfg.get("ping_url"):
-                ping_target = cfg.get("ping_url")
-            elif isinstance(cfg, dict) and cfg.get("redis"):
-                r = cfg.get("redis")
-                host = r.get("host", "127.0.0.1")
-                port = r.get("port", 6379)
-                ping_target = f"{host}:{port}"
+        cfg = load_config()
+        # prefer explicit ping_url if present
+        if cfg.get("ping_url"):
+            ping_target = cfg.get("ping_url")
+        elif cfg.get("redis"):
+            r = cfg.get("redis")
+            host = r.get("host", "127.0.0.1")
+            port = r.get("port", 6379)
+            ping_target = f"{host}:{port}"
     except Exception:
         pass
 
@@ -541,13 +1029,11 @@ def main():
     #     open_browser_fullscreen(CHART_URL, TARGET_MONITOR_FOR_CHART)
     open_browser_fullscreen(CHART_URL)
 
-    # Wait for either process to exit
+    # Wait for the control app to exit (or Ctrl+C / console close)
     try:
-        while True:
-            if ctrl_proc.poll() is not None:
-                print("USV remote control exited.")
-                break
-            time.sleep(1)
+        _wait_for_exit(ctrl_proc)
+        if ctrl_proc.poll() is not None:
+            print("USV remote control exited.")
     finally:
         graceful_shutdown()
 